@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+"""
+compares Duration.from_iso with the former implementation,
+which formatted & searched the pattern on every call
+"""
+import ioex.datetimeex
+import re
+import timeit
+
+Duration = ioex.datetimeex.Duration
+
+legacy_iso_format = r'P((?P<y>\d+)Y)?((?P<d>\d+)D)?' + r'(T(?P<min>\d+)M)?'
+
+
+def legacy_from_iso(iso):
+    match = re.search(r'^{}$'.format(legacy_iso_format), iso)
+    if not match:
+        raise ValueError('unsupported string {!r}'.format(iso))
+    attr = {k: int(v) if v is not None else 0
+            for k, v in match.groupdict().items()}
+    return Duration(years=attr['y'], days=attr['d'], minutes=attr['min'])
+
+
+def uncached_from_iso(iso):
+    return Duration(**dict(
+        ioex.datetimeex._parse_iso_duration_components.__wrapped__(
+            Duration._iso_pattern, iso,
+        ),
+    ))
+
+
+def main(count=100000, distinct=1000, repeat=5):
+    isos = ['P{}Y{}DT{}M'.format(i % distinct // 100, i % 100, i % distinct)
+            for i in range(count)]
+    for name, from_iso in [
+            ('legacy', legacy_from_iso),
+            ('uncached', uncached_from_iso),
+            ('cached', Duration.from_iso)]:
+        seconds = min(timeit.repeat(
+            lambda: [from_iso(iso) for iso in isos],
+            number=1,
+            repeat=repeat,
+        ))
+        print('{:>8} {:.3f}s ({} strings, {} distinct)'.format(
+            name, seconds, count, distinct))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+compares Duration construction with the former AttributeDescriptor,
+which checked types in a list comprehension and used getattr & setattr,
+and with trusted construction skipping or batching validation
+"""
+import ioex.classex
+import ioex.datetimeex
+import timeit
+
+
+class LegacyAttributeDescriptor(object):
+
+    def __init__(self, name, types=None, always_accept_none=False, min=None):
+        self._name = name
+        self._types = types
+        self._always_accept_none = always_accept_none
+        self._min = min
+
+    def __get__(self, instance, owner):
+        return getattr(instance, self._name)
+
+    def __set__(self, instance, value):
+        if self._always_accept_none and value is None:
+            setattr(instance, self._name, None)
+        elif self._types and not any([isinstance(value, t) for t in self._types]):
+            raise TypeError('expected type ϵ {{{}}}, {} ({!r}) given'.format(
+                ', '.join([t.__name__ for t in self._types]),
+                type(value).__name__,
+                value,
+            ))
+        elif self._min is not None and not self._min <= value:
+            raise ValueError('expected value >= {!r}, {!r} given'.format(
+                self._min,
+                value,
+            ))
+        else:
+            setattr(instance, self._name, value)
+
+
+def _legacy_fields():
+    fields = {}
+    for name, types in [('years', (int,)), ('months', (int,)), ('weeks', (int,)),
+                        ('days', (int,)), ('hours', (int,)), ('minutes', (int,)),
+                        ('seconds', (int, float))]:
+        fields[name] = LegacyAttributeDescriptor('_' + name, types=types, min=0)
+    return fields
+
+
+LegacyDuration = type('LegacyDuration', (ioex.datetimeex.Duration,), _legacy_fields())
+
+
+def main(count=100000, repeat=5):
+    Duration = ioex.datetimeex.Duration
+    rows = [dict(years=1, days=i % 30, minutes=i % 60, seconds=1.5) for i in range(count)]
+    for name, construct in [
+            ('legacy', lambda: [LegacyDuration(**row) for row in rows]),
+            ('current', lambda: [Duration(**row) for row in rows]),
+            ('trusted', lambda: [Duration.from_trusted(**row) for row in rows]),
+            ('validated many', lambda: Duration.from_trusted_many(rows, validate=True)),
+            ('trusted many', lambda: Duration.from_trusted_many(rows))]:
+        seconds = min(timeit.repeat(construct, number=1, repeat=repeat))
+        print('{:>14} {:.3f}s ({} durations)'.format(name, seconds, count))
+
+
+if __name__ == '__main__':
+    main()
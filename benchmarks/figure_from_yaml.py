@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+"""
+compares Figure.from_yaml's scalar parsing with the former
+exception driven int() / float() fallback
+"""
+import ioex.calcex
+import ioex.yamlex
+import timeit
+import yaml
+
+
+def legacy_parse_figure_text(text):
+    seg = text.split(' ')
+    if seg[0] == '?':
+        value = None
+    else:
+        try:
+            value = int(seg[0])
+        except ValueError:
+            value = float(seg[0])
+    return value, ' '.join(seg[1:]) if len(seg) > 1 else None
+
+
+def main(count=100000, repeat=5):
+    texts = [['{} kg', '{}.5 m/s', '? EUR', '-{}e3 m'][i % 4].format(i)
+             for i in range(count)]
+    for name, parse in [
+            ('legacy', legacy_parse_figure_text),
+            ('current', ioex.calcex._parse_figure_text)]:
+        seconds = min(timeit.repeat(
+            lambda: [parse(t) for t in texts],
+            number=1,
+            repeat=repeat,
+        ))
+        print('{:>8} parse {:.3f}s ({} scalars)'.format(name, seconds, count))
+
+    loader = ioex.yamlex.loader_class()
+    ioex.calcex.Figure.register_yaml_constructor(loader)
+    document = ''.join('- !figure "{}"\n'.format(t) for t in texts)
+    seconds = min(timeit.repeat(
+        lambda: yaml.load(document, Loader=loader),
+        number=1,
+        repeat=repeat,
+    ))
+    print('{:>8} load  {:.3f}s ({} scalars)'.format('yaml', seconds, count))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+"""
+reports the cumulative import time of ioex modules in fresh interpreters
+(python -X importtime), best of several runs
+"""
+import subprocess
+import sys
+
+
+def import_time(module):
+    """ cumulative microseconds """
+    output = subprocess.check_output(
+        [sys.executable, '-X', 'importtime', '-c', 'import {}'.format(module)],
+        stderr=subprocess.STDOUT,
+    ).decode()
+    for line in output.splitlines():
+        fields = [f.strip() for f in line.split('|')]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1])
+    raise ValueError('no import time reported for {}'.format(module))
+
+
+def main(modules=('ioex', 'ioex.datetimeex', 'ioex.calcex', 'ioex.yamlex'), repeat=7):
+    for module in modules:
+        print('{:>16} {:.1f}ms'.format(
+            module, min(import_time(module) for _ in range(repeat)) / 1000.0))
+
+
+if __name__ == '__main__':
+    main()
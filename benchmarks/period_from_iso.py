@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+"""
+compares Period.from_iso with the former implementation,
+which formatted & searched the pattern on every call
+and parsed both timestamps with dateutil.parser
+"""
+import dateutil.parser
+import ioex.datetimeex
+import re
+import timeit
+
+Period = ioex.datetimeex.Period
+
+
+def legacy_from_iso(iso):
+    match = re.search('^{}$'.format(Period._timeperiod_iso_format), iso)
+    if not match:
+        raise ValueError('unsupported string {!r}'.format(iso))
+    return Period(
+        start=dateutil.parser.parse(match.group('start')),
+        end=dateutil.parser.parse(match.group('end')),
+    )
+
+
+def main(count=20000, repeat=5):
+    suffixes = ['', 'Z', '+02:00', '-05:30']
+    isos = ['2016-07-{:02d}T12:{:02d}:00.{:06d}{s}/2016-07-{:02d}T13:00:00{s}'.format(
+        i % 28 + 1, i % 60, i, i % 28 + 1, s=suffixes[i % len(suffixes)])
+        for i in range(count)]
+    for name, from_iso in [('legacy', legacy_from_iso), ('current', Period.from_iso)]:
+        seconds = min(timeit.repeat(
+            lambda: [from_iso(iso) for iso in isos],
+            number=1,
+            repeat=repeat,
+        ))
+        print('{:>8} {:.3f}s ({} strings)'.format(name, seconds, count))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+"""
+compares construct_yaml_timestamp with the former implementation,
+which searched the scalar for an offset and created new tzinfo objects
+for every timestamp
+"""
+import datetime
+import dateutil.tz.tz
+import ioex.datetimeex
+import ioex.yamlex
+import re
+import sys
+import timeit
+import yaml
+
+
+def legacy_construct_yaml_timestamp(loader, node):
+    loaded_dt = loader.construct_yaml_timestamp(node)
+    if type(loaded_dt) is datetime.datetime and loaded_dt.tzinfo is None:
+        timezone_match = re.search(
+            r'(Z|(?P<sign>[\+-])(?P<h>\d{2}):(?P<m>\d{2}))$',
+            loader.construct_yaml_str(node),
+        )
+        if timezone_match:
+            loaded_dt = loaded_dt.replace(tzinfo=dateutil.tz.tz.tzutc())
+            timezone_attr = timezone_match.groupdict()
+            if timezone_attr['h']:
+                timezone = dateutil.tz.tz.tzoffset(
+                    name=timezone_match.group(0),
+                    offset=(
+                        int(timezone_attr['h']) * 60 + int(timezone_attr['m'])) * 60
+                         * (-1 if timezone_attr['sign'] == '-' else 1),
+                )
+                loaded_dt = loaded_dt.astimezone(timezone)
+    return loaded_dt
+
+
+def main(count=100000, repeat=5):
+    offsets = ['Z', '+02:00', '-05:00', '+05:30']
+    document = yaml.dump(['2016-07-{:02d}T12:{:02d}:00.{:06d}{}'.format(
+        i % 28 + 1, i % 60, i, offsets[i % len(offsets)]) for i in range(count)])
+    # plain scalars get resolved to timestamps
+    document = document.replace("'", '')
+    for name, constructor in [
+            ('legacy', legacy_construct_yaml_timestamp),
+            ('current', ioex.datetimeex.construct_yaml_timestamp)]:
+        loader = ioex.yamlex.loader_class()
+        loader.add_constructor(u'tag:yaml.org,2002:timestamp', constructor)
+        loaded = yaml.load(document, Loader=loader)
+        seconds = min(timeit.repeat(
+            lambda: yaml.load(document, Loader=loader),
+            number=1,
+            repeat=repeat,
+        ))
+        tzinfos = {id(dt.tzinfo): dt.tzinfo for dt in loaded}
+        print('{:>8} {:.3f}s ({} timestamps, {} tzinfo objects of {} bytes in total)'.format(
+            name, seconds, count, len(tzinfos),
+            sum(sys.getsizeof(tz) for tz in tzinfos.values())))
+
+
+if __name__ == '__main__':
+    main()
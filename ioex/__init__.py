@@ -1,13 +1,13 @@
+import collections
 import contextlib
-import difflib
 import ioex.shell
 import locale
-import readline
+import os
 import threading
-try:
-    import yaml
-except ImportError:
-    yaml = None
+# readline, difflib, fnmatch, hashlib, yaml & ioex.yamlex
+# are imported on first use to keep startup of scripts fast
+
+__version__ = '0.18.0'
 
 
 class UnsupportedLocaleSettingError(locale.Error):
@@ -33,6 +33,8 @@ def setlocale(temporary_locale):
 
 
 def raw_input_with_default(prompt, default):
+    import readline
+
     def pre_input_hook():
         readline.insert_text(default)
         readline.redisplay()
@@ -86,15 +88,32 @@ yaml_diff_colors = {
     '+': ioex.shell.TextColor.green,
     '-': ioex.shell.TextColor.red,
     '?': ioex.shell.TextColor.yellow,
+    '@': ioex.shell.TextColor.cyan,
 }
 
 
-def yaml_diff(a, b, dumper=None, colors=False):
+def yaml_diff_lines(a, b, dumper=None, colors=False, libyaml=False,
+                    structural=False, context=None, cache=None):
+    """
+    iterator variant of yaml_diff for streaming diffs to a terminal or file.
+
+    libyaml=None uses libyaml's emitter if available.
+    structural=True compares dicts & lists directly (see ioex.yamlex.structural_diff)
+    instead of running difflib.ndiff on the complete yaml texts.
+    context=n yields unified diff hunks with n unchanged lines of context.
+    cache=ioex.yamlex.OutputCache(...) memoizes the yaml of a & b keyed by
+    their pickled form. it is only used with the default dumper,
+    as custom dumpers can not be told apart by their representers,
+    and not for structural diffs.
+    """
+    import ioex.yamlex
+    import yaml
+    cache_options = None
     if dumper is None:
-        class DiffDumper(yaml.Dumper):
-            pass
-        register_yaml_unicode_as_str_representer(DiffDumper)
-        dumper = DiffDumper
+        dumper = ioex.yamlex.dumper_class(libyaml=libyaml)
+        register_yaml_unicode_as_str_representer(dumper)
+        # Dumper or CDumper
+        cache_options = ('yaml_diff', dumper.__name__)
 
     def to_yaml(data):
         return yaml.dump(
@@ -103,14 +122,212 @@ def yaml_diff(a, b, dumper=None, colors=False):
             default_flow_style=False,
             allow_unicode=True,
         )
-    diff_lines = difflib.ndiff(
-        to_yaml(a).splitlines(True),
-        to_yaml(b).splitlines(True),
-    )
+
+    def cached_to_yaml(data):
+        if cache is None or cache_options is None:
+            return to_yaml(data)
+        import pickle
+        try:
+            pickled = pickle.dumps(data, protocol=2)
+        except Exception:
+            return to_yaml(data)
+        key = cache.key(pickled, options=cache_options)
+        text = cache.get(key)
+        if text is not None:
+            return text.decode('utf-8')
+        text = to_yaml(data)
+        cache.set(key, text.encode('utf-8'))
+        return text
+    if structural:
+        diff_lines = ioex.yamlex.structural_diff(a, b, to_yaml)
+    elif context is None:
+        import difflib
+        diff_lines = difflib.ndiff(
+            cached_to_yaml(a).splitlines(True),
+            cached_to_yaml(b).splitlines(True),
+        )
+    else:
+        diff_lines = ioex.yamlex.line_diff(cached_to_yaml(a), cached_to_yaml(b))
+    if context is not None:
+        diff_lines = ioex.yamlex.unified_diff(diff_lines, context=context)
     if colors:
-        diff_lines = [u'%s%s%s' % (yaml_diff_colors[l[0]], l, ioex.shell.TextColor.default)
-                      for l in diff_lines]
-    return u''.join(diff_lines)
+        diff_lines = (u'%s%s%s' % (yaml_diff_colors[l[0]], l, ioex.shell.TextColor.default)
+                      for l in diff_lines)
+    return diff_lines
+
+
+def yaml_diff(a, b, dumper=None, colors=False, libyaml=False,
+              structural=False, context=None, cache=None):
+    """ see yaml_diff_lines """
+    return u''.join(yaml_diff_lines(
+        a, b,
+        dumper=dumper,
+        colors=colors,
+        libyaml=libyaml,
+        structural=structural,
+        context=context,
+        cache=cache,
+    ))
+
+
+YamlDiffResult = collections.namedtuple(
+    'YamlDiffResult',
+    ['old_path', 'new_path', 'diff', 'error'],
+    defaults=[None],
+)
+
+
+def _file_digest(path, chunk_size=2 ** 16):
+    import hashlib
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def _files_identical(old_path, new_path):
+    if old_path is None or new_path is None:
+        return old_path == new_path
+    elif os.path.getsize(old_path) != os.path.getsize(new_path):
+        return False
+    else:
+        return _file_digest(old_path) == _file_digest(new_path)
+
+
+def _yaml_load_file(path, loader):
+    import yaml
+    if path is None:
+        return None
+    with open(path, 'rb') as f:
+        return yaml.load(f, Loader=loader)
+
+
+_registered_loaders = {}
+
+
+def _registered_loader(loader, register_constructors):
+    """ loader class built once per process, as derived classes can not be pickled """
+    import ioex.yamlex
+    key = (loader, tuple(register_constructors))
+    if key not in _registered_loaders:
+        if loader is None:
+            registered = ioex.yamlex.loader_class()
+        else:
+            registered = type(loader.__name__, (loader,), {})
+        for register_constructor in register_constructors:
+            register_constructor(registered)
+        _registered_loaders[key] = registered
+    return _registered_loaders[key]
+
+
+def _yaml_diff_error(old_path, new_path, ex):
+    # exceptions of yaml are not always picklable
+    return YamlDiffResult(old_path, new_path, u'', u'%s: %s' % (type(ex).__name__, ex))
+
+
+def _yaml_diff_file_pair(old_path, new_path, loader, register_constructors, diff_kwargs):
+    import ioex.yamlex
+    try:
+        loader = _registered_loader(loader, register_constructors)
+        old = _yaml_load_file(old_path, loader)
+        new = _yaml_load_file(new_path, loader)
+        if ioex.yamlex._same(old, new):
+            return YamlDiffResult(old_path, new_path, u'')
+        else:
+            return YamlDiffResult(old_path, new_path, yaml_diff(old, new, **diff_kwargs))
+    except Exception as ex:
+        return _yaml_diff_error(old_path, new_path, ex)
+
+
+def yaml_diff_files(path_pairs, loader=None, processes=None, register_constructors=(),
+                    **diff_kwargs):
+    """
+    yields a YamlDiffResult for each (old_path, new_path) pair in completion order.
+    YamlDiffResult.diff is empty for unchanged documents.
+    YamlDiffResult.error describes why a pair could not be loaded or diffed
+    (None on success), the remaining pairs are still diffed.
+    a path of None stands for a missing file.
+
+    byte-identical files are reported without being loaded.
+    the other pairs are loaded and diffed in a pool of processes
+    (processes=1 diffs in the current process),
+    so loader and a dumper in diff_kwargs need to be picklable.
+
+    loader defaults to ioex.yamlex.loader_class().
+    register_constructors are picklable callables like
+    ioex.calcex.Figure.register_yaml_constructor applied to a class derived
+    from loader in each process, as classes built at runtime can not be pickled.
+    """
+    import concurrent.futures
+    if processes == 1:
+        executor = None
+    else:
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=processes)
+        # bound the queue so results are yielded while path_pairs is consumed
+        window = 2 * (processes or os.cpu_count() or 1)
+    futures = {}
+
+    def results(return_when):
+        done, _ = concurrent.futures.wait(futures, return_when=return_when)
+        for future in done:
+            old_path, new_path = futures.pop(future)
+            try:
+                yield future.result()
+            except Exception as ex:
+                # e.g. arguments or results failing to pickle
+                yield _yaml_diff_error(old_path, new_path, ex)
+
+    try:
+        for old_path, new_path in path_pairs:
+            if _files_identical(old_path, new_path):
+                yield YamlDiffResult(old_path, new_path, u'')
+            elif executor is None:
+                yield _yaml_diff_file_pair(
+                    old_path, new_path, loader, register_constructors, diff_kwargs,
+                )
+            else:
+                if len(futures) >= window:
+                    for result in results(concurrent.futures.FIRST_COMPLETED):
+                        yield result
+                futures[executor.submit(
+                    _yaml_diff_file_pair,
+                    old_path, new_path, loader, register_constructors, diff_kwargs,
+                )] = (old_path, new_path)
+        while futures:
+            for result in results(concurrent.futures.FIRST_COMPLETED):
+                yield result
+    finally:
+        if executor is not None:
+            # drop queued pairs when the caller stops iterating early
+            executor.shutdown(wait=False, cancel_futures=True)
+
+def _tree_paths(root, patterns):
+    import fnmatch
+    for dir_path, dir_names, file_names in os.walk(root):
+        dir_names.sort()
+        for file_name in sorted(file_names):
+            if any(fnmatch.fnmatch(file_name, p) for p in patterns):
+                yield os.path.relpath(os.path.join(dir_path, file_name), root)
+
+
+def yaml_diff_trees(old_root, new_root, patterns=('*.yml', '*.yaml'), **kwargs):
+    """
+    yaml_diff_files for files with equal relative paths in two directory trees.
+    files missing in either tree are diffed against an empty document.
+    """
+    old_paths = set(_tree_paths(old_root, patterns))
+    new_paths = set(_tree_paths(new_root, patterns))
+    return yaml_diff_files(
+        (
+            (
+                os.path.join(old_root, p) if p in old_paths else None,
+                os.path.join(new_root, p) if p in new_paths else None,
+            )
+            for p in sorted(old_paths | new_paths)
+        ),
+        **kwargs
+    )
 
 
 class AutoDict(dict):
@@ -1,4 +1,10 @@
+# -*- coding: utf-8 -*-
+import array
 import copy
+import fractions
+import math
+import operator
+import re
 try:
     import yaml
     import yaml.nodes
@@ -8,15 +14,74 @@ except ImportError:
 
 EMPTY_SUM = sum([])
 
+_IMMUTABLE_TYPES = (type(None), bool, int, float, complex, str, bytes)
+
+
+_numpy_module = False
+
+
+def _numpy():
+    """ numpy or None if unavailable, imported on first use to keep imports fast """
+    global _numpy_module
+    if _numpy_module is False:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy_module = numpy
+    return _numpy_module
+
 
 class UnitMismatchError(ValueError):
     pass
 
 
+class UnknownUnitError(ValueError):
+    pass
+
+
+# int() rejects these characters, float() accepts them (1.5, 1e3, inf, nan)
+_FLOAT_ONLY_CHARS = frozenset('.eEnN')
+
+_interned_units = {}
+
+
+def _intern_unit(unit, max_units=1024):
+    """ lets figures with equal units share one unit object """
+    try:
+        return _interned_units[unit]
+    except KeyError:
+        if len(_interned_units) < max_units:
+            _interned_units[unit] = unit
+        return unit
+
+
+def _parse_figure_text(text):
+    """ parses '<value> <unit>', '<value>', '? <unit>' or '?' """
+    value_text, separator, unit = text.partition(' ')
+    if value_text == '?':
+        value = None
+    elif value_text.isdigit() \
+            or (value_text[:1] in ('+', '-') and value_text[1:].isdigit()):
+        value = int(value_text)
+    elif not _FLOAT_ONLY_CHARS.isdisjoint(value_text):
+        value = float(value_text)
+    else:
+        # 1_000, ...
+        try:
+            value = int(value_text)
+        except ValueError:
+            value = float(value_text)
+    return value, _intern_unit(unit) if separator else None
+
+
 class Figure(object):
 
     yaml_tag = u"!figure"
 
+    # subclasses without __slots__ get an instance dict for extra attributes
+    __slots__ = ('_value', '_unit')
+
     def __init__(self, value=None, unit=None):
         self.value = value
         self.unit = unit
@@ -55,18 +120,8 @@ class Figure(object):
     @classmethod
     def from_yaml(cls, loader, node):
         if isinstance(node, yaml.nodes.ScalarNode):
-            seg = loader.construct_scalar(node).split(' ')
-            if seg[0] == '?':
-                value = None
-            else:
-                try:
-                    value = int(seg[0])
-                except ValueError:
-                    value = float(seg[0])
-            return cls(
-                value=value,
-                unit=' '.join(seg[1:]) if len(seg) > 1 else None,
-            )
+            value, unit = _parse_figure_text(loader.construct_scalar(node))
+            return cls(value=value, unit=unit)
         else:
             return cls(**loader.construct_mapping(node, deep=True))
 
@@ -102,7 +157,9 @@ class Figure(object):
         dumper.add_representer(cls, lambda d, f: cls.to_yaml(d, f, tag=tag))
 
     def __eq__(self, other):
-        return isinstance(self, type(other)) and vars(self) == vars(other)
+        return isinstance(other, Figure) and isinstance(self, type(other)) \
+            and self._value == other._value and self._unit == other._unit \
+            and getattr(self, '__dict__', {}) == getattr(other, '__dict__', {})
 
     def __ne__(self, other):
         return not (self == other)
@@ -188,3 +245,585 @@ class Figure(object):
             value=abs(self.value),
             unit=self.unit,
         )
+
+
+class FrozenFigure(Figure):
+    """
+    immutable & hashable figure.
+    compares value & unit directly instead of instance dicts
+    and computes its hash once.
+    skips copy.deepcopy for values & units of immutable builtin types.
+    """
+
+    __slots__ = ('_hash',)
+
+    def set_value(self, value):
+        try:
+            self._value
+        except AttributeError:
+            self._value = value if type(value) in _IMMUTABLE_TYPES else copy.deepcopy(value)
+        else:
+            raise AttributeError('{} is immutable'.format(type(self).__name__))
+
+    value = property(Figure.get_value, set_value)
+
+    def set_unit(self, unit):
+        try:
+            self._unit
+        except AttributeError:
+            self._unit = unit if type(unit) in _IMMUTABLE_TYPES else copy.deepcopy(unit)
+        else:
+            raise AttributeError('{} is immutable'.format(type(self).__name__))
+
+    unit = property(Figure.get_unit, set_unit)
+
+    def __eq__(self, other):
+        if isinstance(other, FrozenFigure):
+            return self._value == other._value and self._unit == other._unit
+        elif isinstance(other, Figure):
+            # symmetric to Figure.__eq__
+            return isinstance(self, type(other)) \
+                and self._value == other._value and self._unit == other._unit \
+                and not getattr(other, '__dict__', None)
+        return NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __hash__(self):
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash((self._value, self._unit))
+            return self._hash
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (type(self), (self._value, self._unit))
+
+
+def intern_figures(figures, interned=None):
+    """
+    list of FrozenFigure objects for figures,
+    sharing one object per distinct figure.
+    pass the same dict as interned to share objects across calls.
+    figures with unhashable values are frozen but not shared.
+    """
+    if interned is None:
+        interned = {}
+    result = []
+    for figure in figures:
+        if type(figure) is not FrozenFigure:
+            figure = FrozenFigure(figure.value, figure.unit)
+        try:
+            figure = interned.setdefault(figure, figure)
+        except TypeError:
+            pass
+        result.append(figure)
+    return result
+
+
+def unique_figures(figures):
+    """
+    first occurrence of each distinct figure in order,
+    in O(n) unless values are unhashable
+    """
+    unique = []
+    seen = set()
+    for figure in figures:
+        key = (figure.value, figure.unit)
+        try:
+            if key in seen:
+                continue
+            seen.add(key)
+        except TypeError:
+            if figure in unique:
+                continue
+        unique.append(figure)
+    return unique
+
+
+_int64_max = 2 ** 63 - 1
+
+
+def _to_array(values):
+    """ int64 for ints fitting in 64 bits, float64 otherwise, with or without numpy """
+    numpy = _numpy()
+    if numpy is not None:
+        if isinstance(values, numpy.ndarray):
+            return values
+        elif not hasattr(values, '__len__'):
+            values = list(values)
+        values = numpy.asarray(values)
+        # python ints beyond int64 end up as uint64 or object
+        if values.dtype.kind == 'u' \
+                or (values.dtype.kind == 'O'
+                    and all(type(v) in (int, float) for v in values.tolist())):
+            values = values.astype(float)
+        return values
+    values = list(values)
+    if all(type(v) is int for v in values):
+        try:
+            return array.array('q', values)
+        except OverflowError:
+            pass
+    return array.array('d', values)
+
+
+def _max_abs(values):
+    numpy = _numpy()
+    if isinstance(values, numpy.ndarray):
+        return max(abs(int(values.max())), abs(int(values.min()))) if len(values) else 0
+    else:
+        return abs(values)
+
+
+def _int64_overflow(op, values, other):
+    """ numpy wraps int64 results silently """
+    numpy = _numpy()
+    if values.dtype.kind != 'i' \
+            or getattr(other, 'dtype', numpy.dtype(type(other))).kind not in 'iu':
+        return False
+    elif op is operator.mul:
+        return _max_abs(values) * _max_abs(other) > _int64_max
+    elif op in (operator.add, operator.sub):
+        return _max_abs(values) + _max_abs(other) > _int64_max
+    else:
+        return False
+
+
+def _elementwise(op, values, other):
+    numpy = _numpy()
+    if numpy is not None and not _int64_overflow(op, values, other):
+        return op(values, other)
+    # exact python ints, stored as float64 if out of the int64 range
+    elif isinstance(other, array.array) \
+            or (numpy is not None and isinstance(other, numpy.ndarray)):
+        return _to_array(map(op, values.tolist(), other.tolist()))
+    else:
+        return _to_array(op(v, other) for v in values.tolist())
+
+
+class FigureArray(object):
+    """
+    sequence of figures sharing a single unit.
+    values are stored in a numpy.ndarray if numpy is available,
+    otherwise in an array.array.
+    """
+
+    def __init__(self, values=(), unit=None):
+        self.values = values
+        self.unit = unit
+
+    def get_values(self):
+        return self._values
+
+    def set_values(self, values):
+        self._values = _to_array(values)
+
+    """ use property() instead of decorator to enable overriding """
+    values = property(get_values, set_values)
+
+    @classmethod
+    def from_figures(cls, figures, unit=None):
+        figures = list(figures)
+        if unit is None and figures:
+            unit = figures[0].unit
+        for figure in figures:
+            if figure.unit != unit:
+                raise UnitMismatchError('{} in {} array'.format(figure, unit))
+            elif figure.value is None:
+                raise ValueError('{!r} has no value'.format(figure))
+        return cls(values=[f.value for f in figures], unit=unit)
+
+    def to_figures(self, figure_type=Figure):
+        return [figure_type(value=v, unit=self.unit) for v in self.values.tolist()]
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        return iter(self.to_figures())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return type(self)(values=self.values[index], unit=self.unit)
+        value = self.values[index]
+        # numpy scalar to python scalar
+        return Figure(value=value.item() if hasattr(value, 'item') else value,
+                      unit=self.unit)
+
+    def __repr__(self):
+        return '{}(values = {!r}, unit = {})'.format(
+            type(self).__name__, self.values.tolist(), self.unit)
+
+    def __eq__(self, other):
+        return isinstance(self, type(other)) \
+            and self.unit == other.unit \
+            and self.values.tolist() == other.values.tolist()
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def sum(self):
+        numpy = _numpy()
+        if numpy is not None and not (self.values.dtype.kind == 'i'
+                                      and _max_abs(self.values) * len(self) > _int64_max):
+            return Figure(value=self.values.sum().item(), unit=self.unit)
+        else:
+            # exact like sum(figures)
+            return Figure(value=sum(self.values.tolist()), unit=self.unit)
+
+    def _values_of(self, other, operation):
+        if isinstance(other, FigureArray):
+            if len(other) != len(self):
+                raise ValueError('{} {} {}: lengths differ'.format(
+                    len(self), operation, len(other)))
+            return other.values
+        elif isinstance(other, Figure):
+            assert not other.value is None
+            return other.value
+        else:
+            raise NotImplementedError('{!r} {} {!r}'.format(self, operation, other))
+
+    def _operand(self, other, operation):
+        """ unit check once per array instead of per element """
+        values = self._values_of(other, operation)
+        if self.unit != other.unit:
+            raise UnitMismatchError('{} {} {}'.format(self.unit, operation, other.unit))
+        return values
+
+    def _factor(self, other, operation):
+        if not isinstance(other, (Figure, FigureArray)):
+            return other
+        elif other.unit is not None:
+            raise NotImplementedError('{!r} {} {!r}'.format(self, operation, other))
+        else:
+            return self._values_of(other, operation)
+
+    def __add__(self, other):
+        """ allows self + sum([]) """
+        if isinstance(other, type(EMPTY_SUM)) and other == EMPTY_SUM:
+            return type(self)(values=self.values, unit=self.unit)
+        return type(self)(
+            values=_elementwise(operator.add, self.values, self._operand(other, '+')),
+            unit=self.unit,
+        )
+
+    def __radd__(self, other):
+        """ enables use of sum() """
+        if isinstance(other, int) and other == 0:
+            return type(self)(values=self.values, unit=self.unit)
+        else:
+            raise NotImplementedError('{!r} + {!r}'.format(other, self))
+
+    def __sub__(self, other):
+        return type(self)(
+            values=_elementwise(operator.sub, self.values, self._operand(other, '-')),
+            unit=self.unit,
+        )
+
+    def __mul__(self, factor):
+        return type(self)(
+            values=_elementwise(operator.mul, self.values, self._factor(factor, '*')),
+            unit=self.unit,
+        )
+
+    def __rmul__(self, factor):
+        return self * factor
+
+    def __truediv__(self, divisor):
+        if isinstance(divisor, (Figure, FigureArray)) and divisor.unit is not None:
+            values = self._operand(divisor, '/')
+            unit = None
+        else:
+            values = self._factor(divisor, '/')
+            unit = self.unit
+        return type(self)(
+            values=_elementwise(operator.truediv, self.values, values),
+            unit=unit,
+        )
+
+    def __div__(self, divisor):
+        return self.__truediv__(divisor)
+
+    def __round__(self, *params, **kwargs):
+        return type(self)(
+            values=[round(v, *params, **kwargs) for v in self.values.tolist()],
+            unit=self.unit,
+        )
+
+    def __abs__(self):
+        return type(self)(values=[abs(v) for v in self.values.tolist()], unit=self.unit)
+
+
+class FigureAggregate(object):
+    """ count, sum, min & max of figures sharing one unit """
+
+    def __init__(self, unit, count, sum, min, max):
+        self.unit = unit
+        self.count = count
+        self.sum = Figure(value=sum, unit=unit)
+        self.min = Figure(value=min, unit=unit)
+        self.max = Figure(value=max, unit=unit)
+
+    @property
+    def mean(self):
+        return self.sum / self.count
+
+    def __repr__(self):
+        return '{}(unit = {}, count = {}, sum = {!r}, min = {!r}, max = {!r})'.format(
+            type(self).__name__,
+            self.unit,
+            self.count,
+            self.sum.value,
+            self.min.value,
+            self.max.value,
+        )
+
+
+def aggregate_by_unit(figures, summation=None):
+    """
+    returns {unit: FigureAggregate} after a single pass over figures.
+    accumulates raw values and creates figures only once per unit.
+
+    summation='kahan' compensates float rounding errors (Neumaier),
+    summation='fsum' uses math.fsum, keeping all values of a unit in memory.
+    """
+    if summation not in (None, 'kahan', 'fsum'):
+        raise ValueError('unsupported summation {!r}'.format(summation))
+    groups = {}
+    for figure in figures:
+        value = figure.value
+        if value is None:
+            raise ValueError('{!r} has no value'.format(figure))
+        try:
+            group = groups[figure.unit]
+        except KeyError:
+            # count, sum, compensation, min, max, values
+            groups[figure.unit] = [1, value, 0.0, value, value, [value]]
+            continue
+        group[0] += 1
+        if summation == 'kahan':
+            total = group[1] + value
+            if abs(group[1]) >= abs(value):
+                group[2] += (group[1] - total) + value
+            else:
+                group[2] += (value - total) + group[1]
+            group[1] = total
+        elif summation == 'fsum':
+            group[5].append(value)
+        else:
+            group[1] += value
+        if value < group[3]:
+            group[3] = value
+        elif value > group[4]:
+            group[4] = value
+    aggregates = {}
+    for unit, (count, total, compensation, minimum, maximum, values) in groups.items():
+        if summation == 'kahan' and compensation:
+            total += compensation
+        elif summation == 'fsum':
+            # keep sums of ints exact & integral
+            total = sum(values) if all(isinstance(v, int) for v in values) \
+                else math.fsum(values)
+        aggregates[unit] = FigureAggregate(unit, count, total, minimum, maximum)
+    return aggregates
+
+
+_SUPERSCRIPT_DIGITS = {c: str(i) for i, c in enumerate(u'⁰¹²³⁴⁵⁶⁷⁸⁹')}
+
+_unit_token_pattern = re.compile(
+    u'\\s*(?:(?P<op>[()*·/])|(?P<name>[^\\s()*·/^⁻⁰¹²³⁴⁵⁶⁷⁸⁹]+))'
+    + u'(?:\\^(?P<exp>-?\\d+)|(?P<sup>⁻?[⁰¹²³⁴⁵⁶⁷⁸⁹]+))?\\s*'
+)
+
+
+class UnitRegistry(object):
+    """
+    converts between units of equal dimension.
+
+    >>> units = UnitRegistry()
+    >>> units.define('m')
+    >>> units.define('km', 1000, 'm')
+    >>> units.define('s')
+    >>> units.define('h', 3600, 's')
+    >>> units.factor('km/h', 'm/s')
+    0.2777777777777778
+
+    compound units combine defined units with '*', '·', '/', parentheses
+    and exponents ('m^2', 'm²').
+    """
+
+    def __init__(self):
+        self._units = {}
+        self._resolved = {}
+        self._factors = {}
+
+    def define(self, name, factor=1, unit=None):
+        """ name = factor * unit, defines a base unit if unit is None """
+        if unit is None:
+            self._units[name] = (fractions.Fraction(1), ((name, 1),))
+        else:
+            unit_factor, dimension = self.resolve(unit)
+            self._units[name] = (fractions.Fraction(factor) * unit_factor, dimension)
+        self._resolved.clear()
+        self._factors.clear()
+
+    def define_prefixes(self, unit, prefixes=None):
+        """ defines SI prefixed variants of unit (km, mm, μm, ...) """
+        for prefix, factor in (prefixes or SI_PREFIXES).items():
+            self.define(prefix + unit, factor, unit)
+
+    def resolve(self, unit):
+        """ returns (fractions.Fraction factor, dimension) relative to base units """
+        if unit is None:
+            return fractions.Fraction(1), ()
+        try:
+            return self._resolved[unit]
+        except KeyError:
+            tokens = []
+            position = 0
+            while position < len(unit):
+                match = _unit_token_pattern.match(unit, position)
+                if not match or match.end() == position:
+                    raise UnknownUnitError(unit)
+                tokens.append(match.groupdict())
+                position = match.end()
+            factor, exponents, position = self._parse_product(unit, tokens, 0)
+            if position != len(tokens):
+                raise UnknownUnitError(unit)
+            resolved = self._resolved[unit] = (
+                factor,
+                tuple(sorted((b, e) for b, e in exponents.items() if e != 0)),
+            )
+            return resolved
+
+    def _parse_product(self, unit, tokens, position):
+        factor, exponents, position = self._parse_factor(unit, tokens, position)
+        while position < len(tokens) and tokens[position]['op'] in (u'*', u'·', u'/'):
+            sign = -1 if tokens[position]['op'] == u'/' else 1
+            operand_factor, operand_exponents, position \
+                = self._parse_factor(unit, tokens, position + 1)
+            factor *= operand_factor ** sign
+            for base, exponent in operand_exponents.items():
+                exponents[base] = exponents.get(base, 0) + sign * exponent
+        return factor, exponents, position
+
+    def _parse_factor(self, unit, tokens, position):
+        if position >= len(tokens):
+            raise UnknownUnitError(unit)
+        token = tokens[position]
+        if token['name'] is not None:
+            if token['name'] not in self._units:
+                raise UnknownUnitError(token['name'])
+            factor, dimension = self._units[token['name']]
+            exponents = dict(dimension)
+            position += 1
+        elif token['op'] == u'(' and token['exp'] is None and token['sup'] is None:
+            factor, exponents, position = self._parse_product(unit, tokens, position + 1)
+            if position >= len(tokens) or tokens[position]['op'] != u')':
+                raise UnknownUnitError(unit)
+            token = tokens[position]
+            position += 1
+        else:
+            raise UnknownUnitError(unit)
+        if token['exp'] is not None:
+            exponent = int(token['exp'])
+        elif token['sup'] is not None:
+            exponent = int(u''.join(_SUPERSCRIPT_DIGITS.get(c, u'-') for c in token['sup']))
+        else:
+            exponent = 1
+        return (
+            factor ** exponent,
+            {b: e * exponent for b, e in exponents.items()},
+            position,
+        )
+
+    def factor(self, from_unit, to_unit):
+        """ memoized per (from_unit, to_unit) """
+        try:
+            return self._factors[(from_unit, to_unit)]
+        except KeyError:
+            from_factor, from_dimension = self.resolve(from_unit)
+            to_factor, to_dimension = self.resolve(to_unit)
+            if from_dimension != to_dimension:
+                raise UnitMismatchError('{} to {}'.format(from_unit, to_unit))
+            factor = from_factor / to_factor
+            # int factors keep int values integral
+            factor = self._factors[(from_unit, to_unit)] \
+                = int(factor) if factor.denominator == 1 else float(factor)
+            return factor
+
+    def convert(self, figure, unit):
+        if figure.unit == unit:
+            return figure
+        return type(figure)(
+            value=figure.value * self.factor(figure.unit, unit),
+            unit=unit,
+        )
+
+    def convert_array(self, figure_array, unit):
+        if figure_array.unit == unit:
+            return figure_array
+        return type(figure_array)(
+            values=_elementwise(
+                operator.mul,
+                figure_array.values,
+                self.factor(figure_array.unit, unit),
+            ),
+            unit=unit,
+        )
+
+    def sum(self, figures, unit=None):
+        """
+        sums figures of compatible units,
+        converting once per unit instead of once per figure.
+        unit defaults to the unit of the first figure.
+        """
+        sums = {}
+        for figure in figures:
+            assert not figure.value is None
+            if unit is None:
+                unit = figure.unit
+            if figure.unit in sums:
+                sums[figure.unit] += figure.value
+            else:
+                sums[figure.unit] = figure.value
+        return Figure(
+            value=sum(v * self.factor(u, unit) for u, v in sums.items()),
+            unit=unit,
+        )
+
+    def figure_array(self, figures, unit=None):
+        """ FigureArray of figures of compatible units converted to unit """
+        figures = list(figures)
+        if unit is None and figures:
+            unit = figures[0].unit
+        factors = {}
+        values = []
+        for figure in figures:
+            if figure.unit not in factors:
+                factors[figure.unit] = self.factor(figure.unit, unit)
+            values.append(figure.value * factors[figure.unit])
+        return FigureArray(values=values, unit=unit)
+
+
+SI_PREFIXES = {
+    u'T': 10 ** 12,
+    u'G': 10 ** 9,
+    u'M': 10 ** 6,
+    u'k': 10 ** 3,
+    u'h': 10 ** 2,
+    u'd': fractions.Fraction(1, 10),
+    u'c': fractions.Fraction(1, 10 ** 2),
+    u'm': fractions.Fraction(1, 10 ** 3),
+    u'μ': fractions.Fraction(1, 10 ** 6),
+    u'n': fractions.Fraction(1, 10 ** 9),
+}
@@ -5,17 +5,20 @@ class AttributeDescriptor(object):
 
     def __init__(self, name, types=None, always_accept_none=False, min=None):
         self._name = name
-        self._types = types
+        # isinstance accepts a tuple of types
+        self._types = tuple(types) if types else None
         self._always_accept_none = always_accept_none
         self._min = min
 
     def __get__(self, instance, owner):
+        if instance is None:
+            return self
         return getattr(instance, self._name)
 
-    def __set__(self, instance, value):
-        if self._always_accept_none and value is None:
-            setattr(instance, self._name, None)
-        elif self._types and not any([isinstance(value, t) for t in self._types]):
+    def validate(self, value):
+        if value is None and self._always_accept_none:
+            pass
+        elif self._types and not isinstance(value, self._types):
             raise TypeError('expected type ϵ {{{}}}, {} ({!r}) given'.format(
                 ', '.join([t.__name__ for t in self._types]),
                 type(value).__name__,
@@ -26,5 +29,84 @@ class AttributeDescriptor(object):
                 self._min,
                 value,
             ))
-        else:
-            setattr(instance, self._name, value)
+
+    def validate_many(self, values):
+        """ checks like validate but once per distinct type & once for the minimum """
+        if self._always_accept_none:
+            values = [v for v in values if v is not None]
+        if self._types:
+            for value_type in set(map(type, values)):
+                if not issubclass(value_type, self._types):
+                    self.validate(next(v for v in values if type(v) is value_type))
+        if self._min is not None and values:
+            self.validate(min(values))
+
+    def __set__(self, instance, value):
+        # inlined checks, validate raises the appropriate error
+        if not (value is None and self._always_accept_none) and (
+                (self._types and not isinstance(value, self._types))
+                or (self._min is not None and not self._min <= value)):
+            self.validate(value)
+        # works for __dict__ & __slots__, as fast as instance.__dict__[name]
+        setattr(instance, self._name, value)
+
+
+def construct_trusted(cls, **attributes):
+    """
+    creates an instance of cls without calling __init__
+    and assigns attributes without any validation,
+    e.g. the private names of AttributeDescriptors.
+    """
+    instance = cls.__new__(cls)
+    for name, value in attributes.items():
+        setattr(instance, name, value)
+    return instance
+
+
+def validate_many(cls, rows):
+    """
+    validates keyword argument dicts for the AttributeDescriptors of cls,
+    in one pass over the whole batch per attribute
+    """
+    columns = {}
+    for row in rows:
+        for name, value in row.items():
+            columns.setdefault(name, []).append(value)
+    for name, values in columns.items():
+        descriptor = getattr(cls, name, None)
+        if not isinstance(descriptor, AttributeDescriptor):
+            raise TypeError('{} has no attribute descriptor {!r}'.format(cls.__name__, name))
+        descriptor.validate_many(values)
+
+
+def from_trusted_many(cls, rows, validate=False):
+    """
+    list of cls.from_trusted(**row) for an iterable of keyword argument dicts.
+    validate checks all rows with validate_many before constructing any instance.
+    """
+    rows = list(rows)
+    if validate:
+        validate_many(cls, rows)
+    # copy the attributes of a default instance instead of calling
+    # from_trusted per row if all values are kept in the instance's __dict__
+    defaults = getattr(cls.from_trusted(), '__dict__', None)
+    private_names = {}
+    for name in dir(cls):
+        descriptor = getattr(cls, name, None)
+        if isinstance(descriptor, AttributeDescriptor):
+            private_names[name] = descriptor._name
+    if defaults is None or not all(n in defaults for n in private_names.values()):
+        return [cls.from_trusted(**row) for row in rows]
+    instances = []
+    for row in rows:
+        try:
+            attributes = defaults.copy()
+            for name, value in row.items():
+                attributes[private_names[name]] = value
+        except KeyError:
+            instances.append(cls.from_trusted(**row))
+            continue
+        instance = cls.__new__(cls)
+        instance.__dict__ = attributes
+        instances.append(instance)
+    return instances
@@ -1,94 +1,441 @@
+import array
+import bisect
 import datetime
-import dateutil.parser
-import dateutil.relativedelta
-import dateutil.tz.tz
+import functools
 import ioex.classex
 import re
+import sys
+# dateutil & numpy are imported on first use to keep startup of scripts fast
+
+
+@functools.lru_cache(maxsize=256)
+def _offset_tzinfo(seconds):
+    import dateutil.tz.tz
+    if seconds == 0:
+        return dateutil.tz.tz.tzutc()
+    # named like pyyaml's & datetime.timezone's tzinfo, e.g. 'UTC+05:30'
+    minutes, second = divmod(abs(seconds), 60)
+    name = 'UTC%s%02d:%02d' % ('-' if seconds < 0 else '+', minutes // 60, minutes % 60)
+    if second:
+        name += ':%02d' % second
+    return dateutil.tz.tz.tzoffset(name, seconds)
+
+
+def _offset_seconds(offset):
+    if offset == 'Z':
+        return 0
+    hours, _, minutes = offset[1:].partition(':')
+    seconds = (int(hours) * 60 + int(minutes or 0)) * 60
+    return -seconds if offset[0] == '-' else seconds
+
+
+@functools.lru_cache(maxsize=256)
+def _tzoffset(offset):
+    """ shared tzinfo for 'Z', '+HH:MM' & '+H' suffixes, equal to dateutil.parser's """
+    return _offset_tzinfo(_offset_seconds(offset))
+
+
+_yaml_timestamp_pattern = re.compile(
+    r'^(?P<year>\d{4})-(?P<month>\d\d?)-(?P<day>\d\d?)'
+    r'(?:(?:[Tt]|[ \t]+)(?P<hour>\d\d?):(?P<minute>\d\d):(?P<second>\d\d)'
+    r'(?:\.(?P<fraction>\d*))?'
+    r'(?:[ \t]*(?P<tz>Z|[-+]\d\d?(?::\d\d)?))?)?$'
+)
 
 
 def construct_yaml_timestamp(loader, node):
-    loaded_dt = loader.construct_yaml_timestamp(node)
-    if type(loaded_dt) is datetime.datetime and loaded_dt.tzinfo is None:
-        timezone_match = re.search(
-            r'(Z|(?P<sign>[\+-])(?P<h>\d{2}):(?P<m>\d{2}))$',
-            loader.construct_yaml_str(node),
-        )
-        if timezone_match:
-            # loader.construct_yaml_timestamp converts to UTC
-            loaded_dt = loaded_dt.replace(tzinfo=dateutil.tz.tz.tzutc())
-            timezone_attr = timezone_match.groupdict()
-            if timezone_attr['h']:
-                timezone = dateutil.tz.tz.tzoffset(
-                    name=timezone_match.group(0),
-                    offset=(
-                        int(timezone_attr['h']) * 60 + int(timezone_attr['m'])) * 60
-                         * (-1 if timezone_attr['sign'] == '-' else 1),
-                )
-                loaded_dt = loaded_dt.astimezone(timezone)
-    return loaded_dt
+    """
+    like loader.construct_yaml_timestamp but keeps the given utc offset
+    and shares one tzinfo per offset string
+    """
+    match = _yaml_timestamp_pattern.match(loader.construct_scalar(node))
+    if not match:
+        return loader.construct_yaml_timestamp(node)
+    year, month, day, hour, minute, second, fraction, timezone = match.groups()
+    if hour is None:
+        return datetime.date(int(year), int(month), int(day))
+    return datetime.datetime(
+        int(year), int(month), int(day),
+        int(hour), int(minute), int(second),
+        int(fraction[:6].ljust(6, '0')) if fraction else 0,
+        _tzoffset(timezone) if timezone else None,
+    )
 
 
 def register_yaml_timestamp_constructor(loader, tag=u'tag:yaml.org,2002:timestamp'):
     loader.add_constructor(tag, construct_yaml_timestamp)
 
 
+_epoch = datetime.datetime(1970, 1, 1)
+_epoch_ordinal = _epoch.toordinal()
+
+
+def _epoch_days(year, month, day):
+    return datetime.date(int(year), int(month), int(day)).toordinal() - _epoch_ordinal
+
+
+class TimestampColumn(object):
+    """
+    compact sequence of timestamps sharing awareness:
+    microseconds since the epoch in array.array('q')
+    (utc for aware, wall time for naive timestamps)
+    and utc offsets in seconds in array.array('i').
+    """
+
+    def __init__(self, microseconds=(), offsets=None, aware=False):
+        self.microseconds = array.array('q', microseconds)
+        self.offsets = array.array('i', offsets if offsets is not None
+                                   else [0] * len(self.microseconds))
+        if len(self.offsets) != len(self.microseconds):
+            raise ValueError('expected one offset per timestamp')
+        self.aware = aware
+
+    @classmethod
+    def from_datetimes(cls, datetimes):
+        microseconds = array.array('q')
+        offsets = array.array('i')
+        aware = None
+        for dt in datetimes:
+            if not isinstance(dt, datetime.datetime):
+                raise TypeError('expected datetime.datetime, {!r} given'.format(dt))
+            offset = dt.utcoffset()
+            if aware is None:
+                aware = offset is not None
+            elif aware != (offset is not None):
+                raise ValueError('can not mix naive and aware datetimes')
+            delta = dt.replace(tzinfo=None) - _epoch - (offset or datetime.timedelta(0))
+            microseconds.append((delta.days * 86400 + delta.seconds) * 10**6
+                                + delta.microseconds)
+            offsets.append(int(offset.total_seconds()) if offset else 0)
+        return cls(microseconds, offsets, aware=bool(aware))
+
+    @classmethod
+    def _from_yaml_nodes(cls, nodes):
+        """ returns None unless all nodes are timestamps of equal awareness """
+        microseconds = array.array('q')
+        offsets = array.array('i')
+        aware = None
+        # few distinct dates & offsets usually
+        date_seconds = {}
+        offset_seconds = {None: 0}
+        for node in nodes:
+            if node.tag != _yaml_timestamp_tag or not isinstance(node.value, str):
+                return None
+            match = _yaml_timestamp_column_pattern.match(node.value)
+            if not match:
+                return None
+            date, hour, minute, second, fraction, timezone = match.groups()
+            if aware is None:
+                aware = timezone is not None
+            elif aware != (timezone is not None):
+                return None
+            seconds = date_seconds.get(date)
+            if seconds is None:
+                try:
+                    seconds = date_seconds[date] = _epoch_days(*date.split('-')) * 86400
+                except ValueError:
+                    return None
+            offset = offset_seconds.get(timezone)
+            if offset is None:
+                offset = offset_seconds[timezone] = _offset_seconds(timezone)
+            hour, minute, second = int(hour), int(minute), int(second)
+            if hour > 23 or minute > 59 or second > 59:
+                return None
+            microseconds.append(
+                (seconds + hour * 3600 + minute * 60 + second - offset) * 1000000
+                + (int(fraction[:6].ljust(6, '0')) if fraction else 0)
+            )
+            offsets.append(offset)
+        if aware is None:
+            return None
+        column = cls.__new__(cls)
+        column.microseconds = microseconds
+        column.offsets = offsets
+        column.aware = aware
+        return column
+
+    def __len__(self):
+        return len(self.microseconds)
+
+    def __getitem__(self, index):
+        offset = self.offsets[index]
+        dt = _epoch + datetime.timedelta(microseconds=self.microseconds[index] + offset * 10**6)
+        return dt.replace(tzinfo=_offset_tzinfo(offset)) if self.aware else dt
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __eq__(self, other):
+        return (type(self) == type(other)
+                and self.aware == other.aware
+                and self.microseconds == other.microseconds
+                and self.offsets == other.offsets)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def to_numpy(self):
+        """ datetime64[us] array of utc (aware) or wall (naive) times """
+        import numpy
+        return numpy.frombuffer(self.microseconds, dtype=numpy.int64) \
+            .astype('datetime64[us]')
+
+    @classmethod
+    def to_yaml(cls, dumper, column):
+        return dumper.represent_list(list(column))
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, list(self))
+
+    @classmethod
+    def register_yaml_representer(cls, dumper):
+        dumper.add_representer(cls, cls.to_yaml)
+
+
+_yaml_timestamp_tag = u'tag:yaml.org,2002:timestamp'
+# timestamps with time only, date in a single group
+_yaml_timestamp_column_pattern = re.compile(
+    r'^(\d{4}-\d\d?-\d\d?)'
+    r'(?:[Tt]|[ \t]+)(\d\d?):(\d\d):(\d\d)(?:\.(\d*))?'
+    r'(?:[ \t]*(Z|[-+]\d\d?(?::\d\d)?))?$'
+)
+
+
+def construct_yaml_timestamp_column(loader, node):
+    """
+    constructs sequences of timestamps of equal awareness as TimestampColumn
+    without creating datetime objects, other sequences as lists
+    """
+    column = TimestampColumn._from_yaml_nodes(node.value)
+    if column is None:
+        return loader.construct_yaml_seq(node)
+    return column
+
+
+def register_yaml_timestamp_column_constructor(loader, tag=u'tag:yaml.org,2002:seq'):
+    register_yaml_timestamp_constructor(loader)
+    loader.add_constructor(tag, construct_yaml_timestamp_column)
+
+
+def _format_seconds(seconds):
+    if isinstance(seconds, float):
+        # microsecond resolution of datetime.timedelta
+        return ('%.6f' % seconds).rstrip('0').rstrip('.')
+    else:
+        return str(seconds)
+
+
+def _format_iso_duration(years, months, weeks, days, hours, minutes, seconds):
+    iso_str = 'P'
+    if years:
+        iso_str += '{}Y'.format(years)
+    if months:
+        iso_str += '{}M'.format(months)
+    if weeks:
+        iso_str += '{}W'.format(weeks)
+    if days:
+        iso_str += '{}D'.format(days)
+    seconds_str = _format_seconds(seconds) if seconds else '0'
+    if hours or minutes or seconds_str != '0':
+        iso_str += 'T'
+        if hours:
+            iso_str += '{}H'.format(hours)
+        if minutes:
+            iso_str += '{}M'.format(minutes)
+        if seconds_str != '0':
+            iso_str += seconds_str + 'S'
+    return 'P0Y' if iso_str == 'P' else iso_str
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso_duration_components(pattern, iso):
+    match = pattern.match(iso)
+    if not match:
+        raise ValueError('unsupported string {!r}'.format(iso))
+    y, mon, w, d, h, minutes, s = match.group('y', 'mon', 'w', 'd', 'h', 'min', 's')
+    if s is None:
+        seconds = 0
+    elif s.isdigit():
+        seconds = int(s)
+    else:
+        seconds = float(s.replace(',', '.'))
+    return (
+        ('years', int(y) if y else 0),
+        ('months', int(mon) if mon else 0),
+        ('weeks', int(w) if w else 0),
+        ('days', int(d) if d else 0),
+        ('hours', int(h) if h else 0),
+        ('minutes', int(minutes) if minutes else 0),
+        ('seconds', seconds),
+    )
+
+
+def _parse_iso_duration(pattern, iso):
+    """ caches immutable components, not mutable Duration objects """
+    return dict(_parse_iso_duration_components(pattern, iso))
+
+
+_fromisoformat = getattr(datetime.datetime, 'fromisoformat', None)
+
+
+def _parse_iso_timestamp(text):
+    """ fast path for YYYY-MM-DDTHH:MM:SS[.f][Z|+HH:MM] """
+    if text[-1:] == 'Z':
+        naive, offset = text[:-1], 'Z'
+    elif len(text) > 19 and text[-6] in '+-':
+        naive, offset = text[:-6], text[-6:]
+    else:
+        naive, offset = text, None
+    dt = None
+    if _fromisoformat is not None:
+        try:
+            dt = _fromisoformat(naive)
+        except ValueError:
+            # fractions other than 3 or 6 digits before python 3.11
+            pass
+    if dt is None:
+        import dateutil.parser
+        return dateutil.parser.parse(text)
+    return dt if offset is None else dt.replace(tzinfo=_tzoffset(offset))
+
+
 class Duration(object):
 
     yaml_tag = u'!duration'
 
-    iso_format = r'P((?P<y>\d+)Y)?((?P<d>\d+)D)?' \
-        + r'(T(?P<min>\d+)M)?'
+    iso_format = r'P((?P<y>\d+)Y)?((?P<mon>\d+)M)?((?P<w>\d+)W)?((?P<d>\d+)D)?' \
+        + r'(T(?=\d)((?P<h>\d+)H)?((?P<min>\d+)M)?((?P<s>\d+([.,]\d+)?)S)?)?'
+    _iso_pattern = re.compile(r'^{}$'.format(iso_format))
 
     years = ioex.classex.AttributeDescriptor('_years', types=(int,), min=0)
+    months = ioex.classex.AttributeDescriptor('_months', types=(int,), min=0)
+    weeks = ioex.classex.AttributeDescriptor('_weeks', types=(int,), min=0)
     days = ioex.classex.AttributeDescriptor('_days', types=(int,), min=0)
+    hours = ioex.classex.AttributeDescriptor('_hours', types=(int,), min=0)
     minutes = ioex.classex.AttributeDescriptor('_minutes', types=(int,), min=0)
+    seconds = ioex.classex.AttributeDescriptor('_seconds', types=(int, float), min=0)
 
-    def __init__(self, years=0, days=0, minutes=0):
+    def __init__(self, years=0, days=0, minutes=0,
+                 months=0, weeks=0, hours=0, seconds=0):
         self.years = years
+        self.months = months
+        self.weeks = weeks
         self.days = days
+        self.hours = hours
         self.minutes = minutes
+        self.seconds = seconds
+
+    @classmethod
+    def from_trusted(cls, years=0, days=0, minutes=0,
+                     months=0, weeks=0, hours=0, seconds=0):
+        """ skips validation, for values from trusted sources like own caches """
+        return ioex.classex.construct_trusted(
+            cls, _years=years, _months=months, _weeks=weeks, _days=days,
+            _hours=hours, _minutes=minutes, _seconds=seconds,
+        )
+
+    @classmethod
+    def from_trusted_many(cls, rows, validate=False):
+        """ see ioex.classex.from_trusted_many """
+        return ioex.classex.from_trusted_many(cls, rows, validate=validate)
+
+    def _components(self):
+        return (self.years, self.months, self.weeks, self.days,
+                self.hours, self.minutes, self.seconds)
 
     @property
     def isoformat(self):
-        iso_str = re.sub(
-            r'(?<!\d)0.',
-            '',
-            'P{}Y{}DT{}M'.format(self.years, self.days, self.minutes),
-        ).rstrip('T')
-        return 'P0Y' if iso_str == 'P' else iso_str
+        return _format_iso_duration(*self._components())
+
+    @classmethod
+    def format_many(cls, durations):
+        """ isoformat of each duration, formatting equal durations once """
+        formatted = {}
+        iso_strs = []
+        for duration in durations:
+            components = duration._components()
+            try:
+                iso_strs.append(formatted[components])
+            except KeyError:
+                iso_str = formatted[components] = _format_iso_duration(*components)
+                iso_strs.append(iso_str)
+        return iso_strs
 
     @classmethod
     def from_iso(cls, iso):
-        match = re.search(
-            r'^{}$'.format(cls.iso_format),
-            iso,
-        )
-        if not match:
-            raise ValueError('unsupported string {!r}'.format(iso))
-        else:
-            attr = {k: int(v) if v is not None else 0
-                    for k, v in match.groupdict().items()}
-            return cls(
-                years=attr['y'],
-                days=attr['d'],
-                minutes=attr['min'],
-            )
+        return cls(**_parse_iso_duration(cls._iso_pattern, iso))
 
     def __eq__(self, other):
         return (type(self) == type(other)
                 and self.years == other.years
+                and self.months == other.months
+                and self.weeks == other.weeks
                 and self.days == other.days
-                and self.minutes == other.minutes)
+                and self.hours == other.hours
+                and self.minutes == other.minutes
+                and self.seconds == other.seconds)
+
+    def _relativedelta(self):
+        import dateutil.relativedelta
+        return dateutil.relativedelta.relativedelta(
+            years=self.years,
+            months=self.months,
+            weeks=self.weeks,
+            days=self.days,
+            hours=self.hours,
+            minutes=self.minutes,
+            seconds=self.seconds,
+        )
 
     def __radd__(self, dt):
         if not isinstance(dt, datetime.datetime):
             raise TypeError('expected datetime, {!r} given'.format(dt))
         else:
-            return dt + dateutil.relativedelta.relativedelta(
-                years=self.years,
-                days=self.days,
-                minutes=self.minutes,
-            )
+            return dt + self._relativedelta()
+
+    def add_to(self, datetimes):
+        """
+        adds duration to each datetime of a sequence (returns a list)
+        or numpy.datetime64 array (returns an array).
+
+        like relativedelta, years & months are added first
+        with the day clamped to the end of the resulting month.
+        """
+        # arrays require numpy to be imported already
+        numpy = sys.modules.get('numpy')
+        if numpy is not None and isinstance(datetimes, numpy.ndarray):
+            return self._add_to_datetime64(datetimes)
+        delta = self._relativedelta()
+        shifted = []
+        for dt in datetimes:
+            if not isinstance(dt, datetime.datetime):
+                raise TypeError('expected datetime, {!r} given'.format(dt))
+            shifted.append(dt + delta)
+        return shifted
+
+    def _add_to_datetime64(self, values):
+        import numpy
+        if values.dtype.kind != 'M':
+            raise TypeError('expected datetime64 array, {} given'.format(values.dtype))
+        shifted = values
+        month_steps = self.years * 12 + self.months
+        if month_steps:
+            months = values.astype('datetime64[M]')
+            month_starts = months.astype('datetime64[D]')
+            days = values.astype('datetime64[D]') - month_starts
+            time_of_day = values - values.astype('datetime64[D]')
+            target_month_starts = (months + month_steps).astype('datetime64[D]')
+            target_month_lengths = (months + month_steps + 1).astype('datetime64[D]') \
+                - target_month_starts
+            shifted = target_month_starts \
+                + numpy.minimum(days, target_month_lengths - 1) \
+                + time_of_day
+        microseconds = (((self.weeks * 7 + self.days) * 24 + self.hours) * 60
+                        + self.minutes) * 60 * 10 ** 6 + round(self.seconds * 10 ** 6)
+        if microseconds:
+            shifted = shifted + numpy.timedelta64(int(microseconds), 'us')
+        return shifted
 
     @classmethod
     def from_yaml(cls, loader, node):
@@ -104,8 +451,12 @@ class Duration(object):
             tag=tag,
             mapping={k: v for k, v in {
                 'years': duration.years,
+                'months': duration.months,
+                'weeks': duration.weeks,
                 'days': duration.days,
+                'hours': duration.hours,
                 'minutes': duration.minutes,
+                'seconds': duration.seconds,
             }.items() if v != 0},
         )
 
@@ -122,6 +473,7 @@ class Period(object):
     _timeperiod_iso_format = r'(?P<start>{t})\/(?P<end>{t})'.format(
         t=_timestamp_iso_format,
     )
+    _timeperiod_iso_pattern = re.compile(r'^{}$'.format(_timeperiod_iso_format))
 
     start = ioex.classex.AttributeDescriptor(
         '_start',
@@ -138,6 +490,16 @@ class Period(object):
         self.start = start
         self.end = end
 
+    @classmethod
+    def from_trusted(cls, start=None, end=None):
+        """ skips validation, for values from trusted sources like own caches """
+        return ioex.classex.construct_trusted(cls, _start=start, _end=end)
+
+    @classmethod
+    def from_trusted_many(cls, rows, validate=False):
+        """ see ioex.classex.from_trusted_many """
+        return ioex.classex.from_trusted_many(cls, rows, validate=validate)
+
     @property
     def isoformat(self):
         if self.start is None or self.end is None:
@@ -149,20 +511,16 @@ class Period(object):
 
     @classmethod
     def from_iso(cls, iso):
-        match = re.search(
-            '^{}$'.format(cls._timeperiod_iso_format),
-            iso,
-        )
+        match = cls._timeperiod_iso_pattern.match(iso)
         if not match:
             raise ValueError(
                 "given string '%s' does not match the supported pattern '%s'"
                      % (iso, cls._timeperiod_iso_format)
             )
         else:
-            attr = match.groupdict()
             return cls(
-                start=dateutil.parser.parse(attr['start']),
-                end=dateutil.parser.parse(attr['end']),
+                start=_parse_iso_timestamp(match.group('start')),
+                end=_parse_iso_timestamp(match.group('end')),
             )
 
     def __eq__(self, other):
@@ -200,3 +558,314 @@ class Period(object):
     @classmethod
     def register_yaml_representer(cls, dumper):
         dumper.add_representer(cls, cls.to_yaml)
+
+
+class PeriodIndex(object):
+    """
+    index of half-open periods [start, end) for
+    point, overlap & containment queries in O(log n + k).
+
+    periods are kept in an array sorted by start with an implicit
+    interval tree of maximum ends on top of it
+    (https://github.com/lh3/cgranges).
+    insert & remove shift the array and mark the tree stale,
+    it is rebuilt in O(n) on the next query.
+    indexed periods must not be modified.
+    """
+
+    # subtrees below this level are scanned linearly
+    _scan_level = 3
+
+    def __init__(self, periods=()):
+        periods = [self._check(p) for p in periods]
+        periods.sort(key=lambda p: p.start)
+        self._periods = periods
+        self._starts = [p.start for p in periods]
+        self._ends = [p.end for p in periods]
+        self._max_ends = None
+
+    @staticmethod
+    def _check(period):
+        if not isinstance(period, Period):
+            raise TypeError('expected {}, {!r} given'.format(Period.__name__, period))
+        if period.start is None or period.end is None:
+            raise ValueError('both start and end must be set, {!r} given'.format(period))
+        if period.end < period.start:
+            raise ValueError('expected start <= end, {!r} given'.format(period))
+        return period
+
+    def __len__(self):
+        return len(self._periods)
+
+    def __iter__(self):
+        return iter(self._periods)
+
+    def __contains__(self, period):
+        return self._find(period) is not None
+
+    def insert(self, period):
+        self._check(period)
+        index = bisect.bisect_right(self._starts, period.start)
+        self._periods.insert(index, period)
+        self._starts.insert(index, period.start)
+        self._ends.insert(index, period.end)
+        self._max_ends = None
+
+    def remove(self, period):
+        index = self._find(period)
+        if index is None:
+            raise ValueError('{!r} not in index'.format(period))
+        del self._periods[index]
+        del self._starts[index]
+        del self._ends[index]
+        self._max_ends = None
+
+    def _find(self, period):
+        if not isinstance(period, Period) or period.start is None:
+            return None
+        index = bisect.bisect_left(self._starts, period.start)
+        while index < len(self._starts) and self._starts[index] == period.start:
+            if self._periods[index] == period:
+                return index
+            index += 1
+        return None
+
+    def _build(self):
+        ends = self._ends
+        n = len(ends)
+        # suffix maxima cover right subtrees reaching beyond the array
+        self._suffix_max_ends = suffix_max_ends = list(ends)
+        for i in range(n - 2, -1, -1):
+            if suffix_max_ends[i + 1] > suffix_max_ends[i]:
+                suffix_max_ends[i] = suffix_max_ends[i + 1]
+        # node i has level k if the k lowest bits of i are set,
+        # its subtree covers [i - 2**k + 1, i + 2**k - 1]
+        max_ends = list(ends)
+        level = 1
+        while (1 << level) <= n:
+            half = 1 << (level - 1)
+            for i in range((half << 1) - 1, n, half << 2):
+                right = max_ends[i + half] if i + half < n \
+                    else suffix_max_ends[i + 1] if i + 1 < n else ends[i]
+                max_ends[i] = max(ends[i], max_ends[i - half], right)
+            level += 1
+        self._root_level = level - 1
+        self._max_ends = max_ends
+
+    def _subtree_max_end(self, node, level):
+        if node < len(self._max_ends):
+            return self._max_ends[node]
+        first = node - (1 << level) + 1
+        if first < len(self._max_ends):
+            return self._suffix_max_ends[first]
+        return None
+
+    def _search(self, start_ok, end_ok):
+        """
+        indices of periods satisfying both predicates in ascending order.
+        start_ok must hold for a prefix of all starts,
+        end_ok must hold for all ends above some bound.
+        """
+        if not self._periods:
+            return []
+        if self._max_ends is None:
+            self._build()
+        starts, ends, n = self._starts, self._ends, len(self._starts)
+        found = []
+        root = (1 << self._root_level) - 1
+        stack = [(root, self._root_level, False)] \
+            if end_ok(self._max_ends[root]) else []
+        while stack:
+            node, level, left_done = stack.pop()
+            if level <= self._scan_level:
+                for i in range(node - (1 << level) + 1, min(node + (1 << level), n)):
+                    if not start_ok(starts[i]):
+                        break
+                    elif end_ok(ends[i]):
+                        found.append(i)
+            elif not left_done:
+                stack.append((node, level, True))
+                child = node - (1 << (level - 1))
+                max_end = self._subtree_max_end(child, level - 1)
+                if max_end is not None and end_ok(max_end):
+                    stack.append((child, level - 1, False))
+            elif node < n and start_ok(starts[node]):
+                if end_ok(ends[node]):
+                    found.append(node)
+                child = node + (1 << (level - 1))
+                max_end = self._subtree_max_end(child, level - 1)
+                if max_end is not None and end_ok(max_end):
+                    stack.append((child, level - 1, False))
+        return found
+
+    def at(self, dt):
+        """ periods with start <= dt < end """
+        return [self._periods[i] for i in self._search(
+            lambda start: start <= dt,
+            lambda end: end > dt,
+        )]
+
+    def overlapping(self, period):
+        """ periods sharing at least one instant with period """
+        return [self._periods[i] for i in self._search(
+            lambda start: start < period.end,
+            lambda end: end > period.start,
+        )]
+
+    def enclosing(self, period):
+        """ periods with start <= period.start and period.end <= end """
+        return [self._periods[i] for i in self._search(
+            lambda start: start <= period.start,
+            lambda end: end >= period.end,
+        )]
+
+    def within(self, period):
+        """ periods with period.start <= start and end <= period.end """
+        begin = bisect.bisect_left(self._starts, period.start)
+        stop = bisect.bisect_right(self._starts, period.end)
+        return [self._periods[i] for i in range(begin, stop)
+                if self._ends[i] <= period.end]
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, self._periods)
+
+
+def _merge_bounds(bounds):
+    """
+    merges sorted (start, end) pairs overlapping or touching each other,
+    dropping empty ones
+    """
+    merged = []
+    for start, end in bounds:
+        if start >= end:
+            continue
+        elif merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class PeriodSet(object):
+    """
+    set of instants covered by half-open periods [start, end).
+
+    periods are normalized to a sorted list of disjoint, non-adjacent
+    periods, so union, intersection & difference are linear sweeps.
+    """
+
+    yaml_tag = u'!periodset'
+
+    def __init__(self, periods=()):
+        bounds = []
+        for period in periods:
+            PeriodIndex._check(period)
+            bounds.append((period.start, period.end))
+        bounds.sort()
+        self._bounds = _merge_bounds(bounds)
+
+    @classmethod
+    def _from_bounds(cls, bounds):
+        period_set = cls.__new__(cls)
+        period_set._bounds = bounds
+        return period_set
+
+    @property
+    def periods(self):
+        return [Period(start=start, end=end) for start, end in self._bounds]
+
+    def __iter__(self):
+        return iter(self.periods)
+
+    def __len__(self):
+        return len(self._bounds)
+
+    def __bool__(self):
+        return bool(self._bounds)
+
+    def __contains__(self, dt):
+        index = bisect.bisect_right(self._bounds, (dt,)) - 1
+        if index + 1 < len(self._bounds) and self._bounds[index + 1][0] == dt:
+            return True
+        return index >= 0 and dt < self._bounds[index][1]
+
+    def __eq__(self, other):
+        return type(self) == type(other) and self._bounds == other._bounds
+
+    def __ne__(self, other):
+        return not self == other
+
+    def union(self, other):
+        a, b = self._bounds, other._bounds
+        i = j = 0
+        merged = []
+        while i < len(a) or j < len(b):
+            if j == len(b) or (i < len(a) and a[i] <= b[j]):
+                merged.append(a[i])
+                i += 1
+            else:
+                merged.append(b[j])
+                j += 1
+        return self._from_bounds(_merge_bounds(merged))
+
+    def intersection(self, other):
+        a, b = self._bounds, other._bounds
+        i = j = 0
+        intersected = []
+        while i < len(a) and j < len(b):
+            start = max(a[i][0], b[j][0])
+            end = min(a[i][1], b[j][1])
+            if start < end:
+                intersected.append((start, end))
+            if a[i][1] < b[j][1]:
+                i += 1
+            else:
+                j += 1
+        return self._from_bounds(intersected)
+
+    def difference(self, other):
+        a, b = self._bounds, other._bounds
+        j = 0
+        remaining = []
+        for start, end in a:
+            # skip subtrahends ending before the current period
+            while j < len(b) and b[j][1] <= start:
+                j += 1
+            k = j
+            while k < len(b) and b[k][0] < end:
+                if start < b[k][0]:
+                    remaining.append((start, b[k][0]))
+                start = max(start, b[k][1])
+                k += 1
+            if start < end:
+                remaining.append((start, end))
+        return self._from_bounds(remaining)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+    @classmethod
+    def from_yaml(cls, loader, node):
+        return cls(loader.construct_sequence(node, deep=True))
+
+    @classmethod
+    def to_yaml(cls, dumper, period_set):
+        return dumper.represent_sequence(
+            tag=cls.yaml_tag,
+            sequence=period_set.periods,
+        )
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, self.periods)
+
+    @classmethod
+    def register_yaml_constructor(cls, loader, tag=yaml_tag):
+        Period.register_yaml_constructor(loader)
+        loader.add_constructor(tag, cls.from_yaml)
+
+    @classmethod
+    def register_yaml_representer(cls, dumper):
+        Period.register_yaml_representer(dumper)
+        dumper.add_representer(cls, cls.to_yaml)
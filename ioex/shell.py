@@ -14,3 +14,4 @@ class TextColor:
     yellow = '\033[33m'
     blue = '\033[34m'
     magenta = '\033[35m'
+    cyan = '\033[36m'
@@ -0,0 +1,437 @@
+import collections
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+
+def libyaml_available():
+    return yaml is not None and getattr(yaml, '__with_libyaml__', False)
+
+
+def _derive_class(python_base_name, libyaml_base_name, libyaml):
+    if libyaml is None:
+        libyaml = libyaml_available()
+    elif libyaml and not libyaml_available():
+        raise ImportError('pyyaml was built without libyaml bindings')
+    base = getattr(yaml, libyaml_base_name if libyaml else python_base_name)
+    # derive to keep registered constructors & representers local
+    return type(base.__name__, (base,), {})
+
+
+def loader_class(safe=True, libyaml=None):
+    """ libyaml=None selects yaml.CSafeLoader / yaml.CLoader if available """
+    if safe:
+        return _derive_class('SafeLoader', 'CSafeLoader', libyaml)
+    else:
+        return _derive_class('Loader', 'CLoader', libyaml)
+
+
+def dumper_class(safe=False, libyaml=None):
+    """ libyaml=None selects yaml.CSafeDumper / yaml.CDumper if available """
+    if safe:
+        return _derive_class('SafeDumper', 'CSafeDumper', libyaml)
+    else:
+        return _derive_class('Dumper', 'CDumper', libyaml)
+
+
+class OutputCache(object):
+    """
+    on-disk cache of serialized yaml keyed by content hash.
+
+    key() hashes the input together with the options affecting the output
+    and the versions of ioex & pyyaml, so upgrades never return stale entries.
+    the least recently used entries are removed when the files in path
+    exceed max_size bytes, down to low_water * max_size bytes.
+    the total size is tracked approximately in an index file,
+    so writes only scan path when evicting. safe to share between processes.
+    """
+
+    _index_name = '.size'
+
+    def __init__(self, path, max_size=2 ** 28, low_water=0.8):
+        self.path = path
+        self.max_size = max_size
+        self.low_water = low_water
+
+    def key(self, data, options=()):
+        """ data: bytes, options: repr-able description of the serialization """
+        import hashlib
+        import ioex
+        digest = hashlib.sha1(repr((
+            ioex.__version__,
+            getattr(yaml, '__version__', None),
+            options,
+        )).encode('utf-8'))
+        digest.update(data)
+        return digest.hexdigest()
+
+    def get(self, key):
+        """ returns the cached bytes or None """
+        import os
+        entry_path = os.path.join(self.path, key)
+        try:
+            with open(entry_path, 'rb') as entry_file:
+                data = entry_file.read()
+            # modification time tracks recent use
+            os.utime(entry_path, None)
+        except OSError:
+            return None
+        return data
+
+    def set(self, key, data):
+        import os
+        if len(data) > self.max_size:
+            return
+        if not os.path.isdir(self.path):
+            os.makedirs(self.path)
+        self._write(key, data)
+        if self._add_size(len(data)) > self.max_size:
+            self.evict()
+
+    def _write(self, name, data):
+        import os
+        import tempfile
+        temp_fd, temp_path = tempfile.mkstemp(dir=self.path, prefix='.', suffix='.tmp')
+        try:
+            with os.fdopen(temp_fd, 'wb') as temp_file:
+                temp_file.write(data)
+            os.replace(temp_path, os.path.join(self.path, name))
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def _add_size(self, size):
+        """
+        returns the approximate total size after adding size.
+        concurrent writers may lose updates, evict() restores the exact total.
+        """
+        import os
+        try:
+            with open(os.path.join(self.path, self._index_name), 'rb') as index_file:
+                total = int(index_file.read()) + size
+        except (OSError, ValueError):
+            # missing or corrupt index, entries include the new one
+            total = sum(size for mtime, size, entry_path in self._entries())
+        self._write(self._index_name, str(total).encode('ascii'))
+        return total
+
+    def _entries(self):
+        import os
+        for entry in os.scandir(self.path):
+            if not entry.name.startswith('.'):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                yield stat.st_mtime, stat.st_size, entry.path
+
+    def evict(self):
+        """ removes least recently used entries until low_water * max_size is met """
+        import os
+        entries = sorted(self._entries())
+        total = sum(size for mtime, size, entry_path in entries)
+        for mtime, size, entry_path in entries:
+            if total <= self.low_water * self.max_size:
+                break
+            try:
+                os.unlink(entry_path)
+            except OSError:
+                pass
+            total -= size
+        self._write(self._index_name, str(total).encode('ascii'))
+
+
+def _same(a, b):
+    """ stricter than == as 1, 1.0 and True are represented differently """
+    if a is b:
+        return True
+    elif type(a) is not type(b):
+        return False
+    elif type(a) is dict:
+        return len(a) == len(b) \
+            and all(k in b and _same(v, b[k]) for k, v in a.items())
+    elif type(a) in (list, tuple):
+        return len(a) == len(b) and all(_same(x, y) for x, y in zip(a, b))
+    else:
+        return a == b
+
+
+def _myers_matches(a, b, equal, max_cost):
+    """ https://blog.jcoglan.com/2017/02/12/the-myers-diff-algorithm-part-1/ """
+    n, m = len(a), len(b)
+    v = {1: 0}
+    trace = []
+    for d in range(min(n + m, max_cost) + 1):
+        trace.append(dict(v))
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[k - 1] < v[k + 1]):
+                x = v[k + 1]
+            else:
+                x = v[k - 1] + 1
+            y = x - k
+            while x < n and y < m and equal(a[x], b[y]):
+                x, y = x + 1, y + 1
+            v[k] = x
+            if x >= n and y >= m:
+                matches = []
+                for d in range(d, -1, -1):
+                    v = trace[d]
+                    k = x - y
+                    if k == -d or (k != d and v[k - 1] < v[k + 1]):
+                        prev_k = k + 1
+                    else:
+                        prev_k = k - 1
+                    prev_x = v[prev_k]
+                    prev_y = prev_x - prev_k
+                    while x > prev_x and y > prev_y:
+                        x, y = x - 1, y - 1
+                        matches.append((x, y))
+                    x, y = prev_x, prev_y
+                matches.reverse()
+                return matches
+    return None
+
+
+def sequence_opcodes(a, b, equal=_same, max_cost=1024):
+    """
+    difflib.SequenceMatcher.get_opcodes() compatible opcodes
+    for sequences of unhashable items.
+    falls back to a single replace block when more than max_cost
+    items differ.
+    """
+    lo = 0
+    while lo < len(a) and lo < len(b) and equal(a[lo], b[lo]):
+        lo += 1
+    a_hi, b_hi = len(a), len(b)
+    while a_hi > lo and b_hi > lo and equal(a[a_hi - 1], b[b_hi - 1]):
+        a_hi, b_hi = a_hi - 1, b_hi - 1
+    matches = _myers_matches(a[lo:a_hi], b[lo:b_hi], equal, max_cost)
+    if matches is None:
+        matches = []
+    matches = [(i + lo, j + lo) for i, j in matches]
+    matches = [(i, i) for i in range(lo)] + matches \
+        + [(a_hi + i, b_hi + i) for i in range(len(a) - a_hi)]
+    opcodes = []
+    i = j = 0
+    for match_i, match_j in matches + [(len(a), len(b))]:
+        if i < match_i and j < match_j:
+            opcodes.append(('replace', i, match_i, j, match_j))
+        elif i < match_i:
+            opcodes.append(('delete', i, match_i, j, j))
+        elif j < match_j:
+            opcodes.append(('insert', i, i, j, match_j))
+        if match_i < len(a):
+            if opcodes and opcodes[-1][0] == 'equal':
+                opcodes[-1] = ('equal', opcodes[-1][1], match_i + 1,
+                               opcodes[-1][3], match_j + 1)
+            else:
+                opcodes.append(('equal', match_i, match_i + 1,
+                                match_j, match_j + 1))
+        i, j = match_i + 1, match_j + 1
+    return opcodes
+
+
+def _diff_text(a_text, b_text):
+    import difflib
+    a_lines = a_text.splitlines(True)
+    b_lines = b_text.splitlines(True)
+    matcher = difflib.SequenceMatcher(None, a_lines, b_lines)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            for line in a_lines[i1:i2]:
+                yield ' ', line
+        else:
+            for line in a_lines[i1:i2]:
+                yield '-', line
+            for line in b_lines[j1:j2]:
+                yield '+', line
+
+
+def _equal_text(text):
+    for line in text.splitlines(True):
+        yield ' ', line
+
+
+def _indent(diff, first_prefix, prefix):
+    old_prefix = new_prefix = first_prefix
+    for tag, line in diff:
+        if tag == ' ' and old_prefix != new_prefix:
+            yield '-', old_prefix + line
+            yield '+', new_prefix + line
+        elif tag == ' ':
+            yield ' ', (old_prefix + line) if line != '\n' else line
+        elif tag == '-':
+            yield '-', (old_prefix + line) if line != '\n' else line
+        else:
+            yield '+', (new_prefix + line) if line != '\n' else line
+        if tag in ' -':
+            old_prefix = prefix
+        if tag in ' +':
+            new_prefix = prefix
+
+
+def _nestable(a, b):
+    return type(a) is type(b) and type(a) in (dict, list) and a and b
+
+
+def _diff_mapping(a, b, to_yaml):
+    try:
+        keys = sorted(set(a) | set(b))
+    except TypeError:
+        for line in _diff_text(to_yaml(a), to_yaml(b)):
+            yield line
+        return
+    # serialize runs of unchanged entries at once
+    unchanged_keys = []
+    for key in keys:
+        if key in a and key in b and _same(a[key], b[key]):
+            unchanged_keys.append(key)
+            continue
+        elif unchanged_keys:
+            for line in _equal_text(to_yaml({k: a[k] for k in unchanged_keys})):
+                yield line
+            unchanged_keys = []
+        if key not in b:
+            for line in to_yaml({key: a[key]}).splitlines(True):
+                yield '-', line
+        elif key not in a:
+            for line in to_yaml({key: b[key]}).splitlines(True):
+                yield '+', line
+        else:
+            header = to_yaml({key: [None]}).splitlines(True)
+            if _nestable(a[key], b[key]) and len(header) == 2:
+                yield ' ', header[0]
+                # block sequences are not indented within mappings
+                prefix = '  ' if type(a[key]) is dict else ''
+                for line in _indent(_diff_nodes(a[key], b[key], to_yaml), prefix, prefix):
+                    yield line
+            else:
+                for line in _diff_text(to_yaml({key: a[key]}), to_yaml({key: b[key]})):
+                    yield line
+    if unchanged_keys:
+        for line in _equal_text(to_yaml({k: a[k] for k in unchanged_keys})):
+            yield line
+
+
+def _diff_sequence(a, b, to_yaml):
+    for tag, i1, i2, j1, j2 in sequence_opcodes(a, b):
+        if tag == 'equal':
+            for line in _equal_text(to_yaml(a[i1:i2])):
+                yield line
+        elif tag == 'replace' and i2 - i1 == j2 - j1:
+            for x, y in zip(a[i1:i2], b[j1:j2]):
+                if _nestable(x, y):
+                    for line in _indent(_diff_nodes(x, y, to_yaml), '- ', '  '):
+                        yield line
+                else:
+                    for line in _diff_text(to_yaml([x]), to_yaml([y])):
+                        yield line
+        elif tag == 'replace':
+            for line in _diff_text(to_yaml(a[i1:i2]), to_yaml(b[j1:j2])):
+                yield line
+        elif tag == 'delete':
+            for line in to_yaml(a[i1:i2]).splitlines(True):
+                yield '-', line
+        else:
+            for line in to_yaml(b[j1:j2]).splitlines(True):
+                yield '+', line
+
+
+def _diff_nodes(a, b, to_yaml):
+    if _same(a, b):
+        return _equal_text(to_yaml(a))
+    elif _nestable(a, b) and type(a) is dict:
+        return _diff_mapping(a, b, to_yaml)
+    elif _nestable(a, b):
+        return _diff_sequence(a, b, to_yaml)
+    else:
+        return _diff_text(to_yaml(a), to_yaml(b))
+
+
+def structural_diff(a, b, to_yaml):
+    """
+    yields difflib.ndiff style lines without intraline hints.
+
+    walks plain dicts & lists instead of diffing the complete yaml texts
+    and only serializes changed subtrees with to_yaml,
+    so line wrapping and anchors may differ from to_yaml(a) & to_yaml(b).
+    """
+    for tag, line in _diff_nodes(a, b, to_yaml):
+        yield u'%s %s' % (tag, line)
+
+
+def line_diff(a_text, b_text):
+    """ yields difflib.ndiff style lines without intraline hints """
+    for tag, line in _diff_text(a_text, b_text):
+        yield u'%s %s' % (tag, line)
+
+
+def _format_range(start, length):
+    """ difflib._format_range_unified """
+    if length == 1:
+        return '{}'.format(start + 1)
+    else:
+        return '{},{}'.format(start + 1 if length else start, length)
+
+
+def unified_diff(diff_lines, context=3, from_name=None, to_name=None):
+    """
+    converts difflib.ndiff style lines to unified diff hunks
+    with context unchanged lines around each change.
+    consumes diff_lines lazily and buffers at most one hunk.
+    """
+    old_no = new_no = 0
+    before = collections.deque(maxlen=context)
+    hunk = gap = None
+    for line in diff_lines:
+        tag, text = line[0], line[2:]
+        if tag == '?':
+            continue
+        elif tag == ' ':
+            old_no, new_no = old_no + 1, new_no + 1
+            if hunk is None:
+                before.append(text)
+                continue
+            gap.append(text)
+            if len(gap) <= 2 * context:
+                continue
+            for hunk_line in _close_hunk(hunk, gap[:context]):
+                yield hunk_line
+            before = collections.deque(gap, maxlen=context)
+            hunk = gap = None
+            continue
+        if hunk is None:
+            if from_name is not None or to_name is not None:
+                yield u'--- {}\n'.format(from_name or '')
+                yield u'+++ {}\n'.format(to_name or '')
+                from_name = to_name = None
+            hunk = [old_no - len(before), 0, new_no - len(before), 0, []]
+            gap = list(before)
+            before.clear()
+        hunk[1] += len(gap)
+        hunk[3] += len(gap)
+        hunk[4].extend(u' ' + l for l in gap)
+        gap = []
+        if tag == '-':
+            hunk[1] += 1
+            old_no += 1
+        else:
+            hunk[3] += 1
+            new_no += 1
+        hunk[4].append(tag + text)
+    if hunk is not None:
+        for hunk_line in _close_hunk(hunk, gap[:context]):
+            yield hunk_line
+
+
+def _close_hunk(hunk, trailing_context):
+    old_start, old_length, new_start, new_length, lines = hunk
+    yield u'@@ -{} +{} @@\n'.format(
+        _format_range(old_start, old_length + len(trailing_context)),
+        _format_range(new_start, new_length + len(trailing_context)),
+    )
+    for line in lines:
+        yield line
+    for line in trailing_context:
+        yield u' ' + line
@@ -1,11 +1,15 @@
 from setuptools import setup
 
 import glob
+import re
+
+with open('ioex/__init__.py') as init_file:
+    version = re.search(r"^__version__ = '([^']+)'", init_file.read(), re.M).group(1)
 
 setup(
     name = 'ioex',
     packages = ['ioex'],
-    version = '0.18.0',
+    version = version,
     description = 'extension for python\'s build-in input / output interface',
     author = 'Fabian Peter Hammerle',
     author_email = 'fabian.hammerle@gmail.com',
@@ -14,6 +18,7 @@ setup(
     keywords = [],
     classifiers = [],
     scripts = glob.glob('scripts/*'),
+    python_requires = '>=3.7',
     install_requires = ['python-dateutil'],
     tests_require = ['pytest', 'pytz'],
     )
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from ioex.calcex import Figure, aggregate_by_unit
+
+
+@pytest.mark.parametrize(('summation'), [None, 'kahan', 'fsum'])
+def test_aggregate_by_unit(summation):
+    aggregates = aggregate_by_unit([
+        Figure(3, 'm'),
+        Figure(1.5, 's'),
+        Figure(1, 'm'),
+        Figure(-2, 'm'),
+        Figure(4),
+    ], summation=summation)
+    assert set(['m', 's', None]) == set(aggregates.keys())
+    m = aggregates['m']
+    assert 'm' == m.unit
+    assert 3 == m.count
+    assert Figure(2, 'm') == m.sum
+    assert int == type(m.sum.value)
+    assert Figure(-2, 'm') == m.min
+    assert Figure(3, 'm') == m.max
+    assert Figure(2.0 / 3, 'm') == m.mean
+    assert 1 == aggregates['s'].count
+    assert Figure(1.5, 's') == aggregates['s'].sum
+    assert Figure(1.5, 's') == aggregates['s'].mean
+    assert Figure(4) == aggregates[None].max
+
+
+def test_aggregate_by_unit_empty():
+    assert {} == aggregate_by_unit([])
+
+
+def test_aggregate_by_unit_generator():
+    aggregates = aggregate_by_unit(Figure(i, 'kg') for i in range(1000))
+    assert Figure(499500, 'kg') == aggregates['kg'].sum
+    assert Figure(499.5, 'kg') == aggregates['kg'].mean
+
+
+@pytest.mark.parametrize(('summation', 'expected_sum'), [
+    ['kahan', 1.0],
+    ['fsum', 1.0],
+])
+def test_aggregate_by_unit_compensated(summation, expected_sum):
+    figures = [Figure(0.1, 'm')] * 10
+    assert 1.0 != sum(f.value for f in figures)
+    assert expected_sum == aggregate_by_unit(figures, summation=summation)['m'].sum.value
+
+
+def test_aggregate_by_unit_kahan_cancellation():
+    figures = [Figure(v, 'm') for v in [1.0, 1e100, 1.0, -1e100]]
+    assert 2.0 == aggregate_by_unit(figures, summation='kahan')['m'].sum.value
+
+
+@pytest.mark.parametrize(('figures', 'summation'), [
+    [[Figure(None, 'm')], None],
+    [[Figure(1, 'm')], 'pairwise'],
+])
+def test_aggregate_by_unit_fail(figures, summation):
+    with pytest.raises(ValueError):
+        aggregate_by_unit(figures, summation=summation)
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+import array
+import ioex.calcex
+from ioex.calcex import Figure, FigureArray, UnitMismatchError
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@pytest.fixture(params=['array', 'numpy'], autouse=True)
+def backend(request, monkeypatch):
+    if request.param == 'numpy':
+        if numpy is None:
+            pytest.skip('numpy unavailable')
+    else:
+        monkeypatch.setattr(ioex.calcex, '_numpy', lambda: None)
+    return request.param
+
+
+def rebuilt(obj):
+    """ parameters are created before the backend fixture applies """
+    if isinstance(obj, FigureArray):
+        return FigureArray(obj.values.tolist(), obj.unit)
+    return obj
+
+
+def test_init():
+    a = FigureArray([1, 2, 3], u'm/s²')
+    assert [1, 2, 3] == a.values.tolist()
+    assert u'm/s²' == a.unit
+    assert 3 == len(a)
+
+
+def test_init_array_type(backend):
+    if backend == 'array':
+        assert 'q' == FigureArray([1, 2]).values.typecode
+        assert 'd' == FigureArray([1, 2.5]).values.typecode
+        assert 'd' == FigureArray([2 ** 70]).values.typecode
+    else:
+        assert isinstance(FigureArray([1, 2]).values, numpy.ndarray)
+
+
+def test_from_figures():
+    a = FigureArray.from_figures([Figure(1, 'kg'), Figure(2.5, 'kg')])
+    assert FigureArray([1, 2.5], 'kg') == a
+
+
+@pytest.mark.parametrize(('figures', 'unit', 'exception_type'), [
+    [[Figure(1, 'kg'), Figure(2, 'g')], None, UnitMismatchError],
+    [[Figure(1, 'kg')], 'g', UnitMismatchError],
+    [[Figure(None, 'kg')], None, ValueError],
+])
+def test_from_figures_fail(figures, unit, exception_type):
+    with pytest.raises(exception_type):
+        FigureArray.from_figures(figures, unit=unit)
+
+
+def test_to_figures():
+    assert [Figure(1, 'm'), Figure(2, 'm')] == FigureArray([1, 2], 'm').to_figures()
+    assert [Figure(1, 'm'), Figure(2, 'm')] == list(FigureArray([1, 2], 'm'))
+
+
+def test_getitem():
+    a = FigureArray([1, 2, 3], 'm')
+    assert Figure(2, 'm') == a[1]
+    assert int == type(a[1].value)
+    assert Figure(3, 'm') == a[-1]
+    assert FigureArray([2, 3], 'm') == a[1:]
+
+
+@pytest.mark.parametrize(('a', 'b', 'expected'), [
+    [FigureArray([1, 2], 'm'), FigureArray([3, 4], 'm'), FigureArray([4, 6], 'm')],
+    [FigureArray([1, 2], 'm'), FigureArray([0.5, 4], 'm'), FigureArray([1.5, 6.0], 'm')],
+    [FigureArray([1, 2], 'm'), Figure(3, 'm'), FigureArray([4, 5], 'm')],
+    [FigureArray([1, 2]), Figure(3), FigureArray([4, 5])],
+    [FigureArray([1, 2], 'm'), sum([]), FigureArray([1, 2], 'm')],
+])
+def test_add(a, b, expected):
+    a, b, expected = rebuilt(a), rebuilt(b), rebuilt(expected)
+    assert expected == a + b
+
+
+@pytest.mark.parametrize(('a', 'b', 'expected'), [
+    [FigureArray([1, 2], 'm'), FigureArray([3, 5], 'm'), FigureArray([-2, -3], 'm')],
+    [FigureArray([1, 2], 'm'), Figure(3, 'm'), FigureArray([-2, -1], 'm')],
+])
+def test_sub(a, b, expected):
+    a, b, expected = rebuilt(a), rebuilt(b), rebuilt(expected)
+    assert expected == a - b
+
+
+@pytest.mark.parametrize(('a', 'b'), [
+    [FigureArray([1, 2], 'm'), FigureArray([3, 4], 's')],
+    [FigureArray([1, 2], 'm'), FigureArray([3, 4])],
+    [FigureArray([1, 2], 'm'), Figure(3, 's')],
+])
+def test_add_sub_unit_mismatch(a, b):
+    a, b = rebuilt(a), rebuilt(b)
+    with pytest.raises(UnitMismatchError):
+        a + b
+    with pytest.raises(UnitMismatchError):
+        a - b
+
+
+def test_add_length_mismatch():
+    with pytest.raises(ValueError):
+        FigureArray([1, 2], 'm') + FigureArray([1], 'm')
+
+
+@pytest.mark.parametrize(('a', 'factor', 'expected'), [
+    [FigureArray([1, 2], 'm'), 3, FigureArray([3, 6], 'm')],
+    [FigureArray([1, 2], 'm'), 0.5, FigureArray([0.5, 1.0], 'm')],
+    [FigureArray([1, 2], 'm'), Figure(3), FigureArray([3, 6], 'm')],
+    [FigureArray([1, 2], 'm'), FigureArray([3, 4]), FigureArray([3, 8], 'm')],
+])
+def test_mul(a, factor, expected):
+    a, factor, expected = rebuilt(a), rebuilt(factor), rebuilt(expected)
+    assert expected == a * factor
+
+
+def test_mul_unit():
+    with pytest.raises(NotImplementedError):
+        FigureArray([1, 2], 'm') * Figure(3, 'm')
+
+
+@pytest.mark.parametrize(('a', 'divisor', 'expected'), [
+    [FigureArray([1, 2], 'm'), 2, FigureArray([0.5, 1.0], 'm')],
+    [FigureArray([1, 2], 'm'), Figure(4), FigureArray([0.25, 0.5], 'm')],
+    [FigureArray([1, 2], 'm'), Figure(4, 'm'), FigureArray([0.25, 0.5])],
+    [FigureArray([1, 3], 'm'), FigureArray([2, 4], 'm'), FigureArray([0.5, 0.75])],
+])
+def test_truediv(a, divisor, expected):
+    a, divisor, expected = rebuilt(a), rebuilt(divisor), rebuilt(expected)
+    assert expected == a / divisor
+
+
+def test_truediv_unit_mismatch():
+    with pytest.raises(UnitMismatchError):
+        FigureArray([1, 2], 'm') / Figure(4, 's')
+
+
+def test_sum():
+    assert Figure(6, 'm') == FigureArray([1, 2, 3], 'm').sum()
+    assert Figure(1.5, 'm') == FigureArray([1, 0.5], 'm').sum()
+
+
+def test_abs():
+    assert FigureArray([1, 2.5], 'm') == abs(FigureArray([-1, 2.5], 'm'))
+
+
+def test_eq():
+    assert FigureArray([1, 2], 'm') == FigureArray([1, 2], 'm')
+    assert FigureArray([1, 2], 'm') != FigureArray([1, 2], 's')
+    assert FigureArray([1, 2], 'm') != FigureArray([1, 3], 'm')
+    assert FigureArray([1, 2], 'm') != [Figure(1, 'm'), Figure(2, 'm')]
+
+
+def test_init_out_of_int64_range():
+    assert [float(2 ** 63), 1.0] == FigureArray([2 ** 63, 1]).values.tolist()
+    assert [float(2 ** 70), 1.5] == FigureArray([2 ** 70, 1.5]).values.tolist()
+    assert [2 ** 63 - 1, -2 ** 63] == FigureArray([2 ** 63 - 1, -2 ** 63]).values.tolist()
+
+
+def test_reflected():
+    a = FigureArray([1, 2.5], 'm')
+    assert FigureArray([2, 5.0], 'm') == sum([a, a])
+    assert FigureArray([2, 5.0], 'm') == 2 * a
+    with pytest.raises(NotImplementedError):
+        1 + a
+
+
+@pytest.mark.parametrize(('values', 'params', 'expected'), [
+    [[1.4, 2.6, -1], (), [1, 3, -1]],
+    [[1.26, 2], (1,), [1.3, 2]],
+])
+def test_round(values, params, expected):
+    rounded = round(FigureArray(values, 'm'), *params)
+    assert FigureArray(expected, 'm') == rounded
+    assert [round(Figure(v, 'm'), *params) for v in values] == rounded.to_figures()
+
+
+@pytest.mark.parametrize(('values'), [
+    [2 ** 62, 2 ** 62],
+    [2 ** 63 - 1, 1],
+    [-2 ** 63, -1],
+    [2 ** 40] * 2 ** 10,
+])
+def test_sum_exact(values):
+    a = FigureArray(values, 'm')
+    assert Figure(sum(values), 'm') == a.sum()
+    assert sum(Figure(v, 'm') for v in values) == a.sum()
+
+
+@pytest.mark.parametrize(('expression', 'expected'), [
+    [lambda: FigureArray([2 ** 62, 1], 'm') + FigureArray([2 ** 62, 1], 'm'), [2.0 ** 63, 2.0]],
+    [lambda: FigureArray([-2 ** 62], 'm') - Figure(2 ** 62 + 1, 'm'), [-2.0 ** 63 - 1]],
+    [lambda: FigureArray([2 ** 62, 3], 'm') * 4, [2.0 ** 64, 12.0]],
+    [lambda: FigureArray([2 ** 31, 3], 'm') * 2 ** 31, [2 ** 62, 3 * 2 ** 31]],
+])
+def test_int64_overflow(expression, expected):
+    result = expression()
+    assert expected == result.values.tolist()
+    assert [type(v) for v in expected] == [type(v) for v in result.values.tolist()]
@@ -162,3 +162,42 @@ def test_to_yaml_subclass_implicit_tag(yaml_dumper):
         Dumper=TestDumper,
     )
     assert "!subfig '12.34 EUR'\n" == subfig_yaml
+
+
+@pytest.mark.parametrize(('figure_yaml', 'expected_figure'), [
+    ['!fig +12 m', Figure(12, 'm')],
+    ['!fig -.5 m', Figure(-0.5, 'm')],
+    ['!fig 1e3 m', Figure(1000.0, 'm')],
+    ['!fig 1_000 m', Figure(1000, 'm')],
+    ['!fig "1  m"', Figure(1, ' m')],
+    ['!fig "1 "', Figure(1, '')],
+    ['!fig 1.0 a b', Figure(1.0, 'a b')],
+])
+def test_from_yaml_scalar_forms(figure_yaml, expected_figure):
+    class TestLoader(yaml.SafeLoader):
+        pass
+    Figure.register_yaml_constructor(TestLoader, tag='!fig')
+    generated_figure = yaml.load(figure_yaml, Loader=TestLoader)
+    assert expected_figure == generated_figure
+    assert isinstance(generated_figure.value, type(expected_figure.value))
+
+
+@pytest.mark.parametrize(('figure_yaml'), [
+    '!fig 0x10 m',
+    '!fig 1.2.3',
+    '!fig "?x"',
+])
+def test_from_yaml_scalar_invalid(figure_yaml):
+    class TestLoader(yaml.SafeLoader):
+        pass
+    Figure.register_yaml_constructor(TestLoader, tag='!fig')
+    with pytest.raises(ValueError):
+        yaml.load(figure_yaml, Loader=TestLoader)
+
+
+def test_from_yaml_unit_interned():
+    class TestLoader(yaml.SafeLoader):
+        pass
+    Figure.register_yaml_constructor(TestLoader, tag='!fig')
+    figures = yaml.load('[!fig 1 km/h, !fig 2 km/h]', Loader=TestLoader)
+    assert figures[0].unit is figures[1].unit
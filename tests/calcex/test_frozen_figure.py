@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+import copy
+import ioex.calcex
+from ioex.calcex import Figure, FrozenFigure
+yaml = pytest.importorskip('yaml')
+
+
+@pytest.mark.parametrize(('value', 'unit'), [
+    [None, None],
+    [1234, None],
+    [123.4, u'm/s²'],
+    [1234, u'米/s²'],
+])
+def test_init(value, unit):
+    f = FrozenFigure(value, unit)
+    assert value == f.value
+    assert unit == f.unit
+    assert Figure(value, unit) == f
+
+
+def test_no_copy_immutable():
+    unit = u''.join([u'k', u'g'])
+    value = 2 ** 80
+    f = FrozenFigure(value, unit)
+    assert value is f.value
+    assert unit is f.unit
+
+
+def test_copy_mutable():
+    value = [1, 2]
+    f = FrozenFigure(value)
+    value.append(3)
+    assert [1, 2] == f.value
+
+
+@pytest.mark.parametrize(('attr'), ['value', 'unit'])
+def test_immutable(attr):
+    f = FrozenFigure(1, 'm')
+    with pytest.raises(AttributeError):
+        setattr(f, attr, 2)
+    assert FrozenFigure(1, 'm') == f
+
+
+def test_hash():
+    assert hash(FrozenFigure(1, 'm')) == hash(FrozenFigure(1, 'm'))
+    assert 2 == len({FrozenFigure(1, 'm'), FrozenFigure(1, 'm'), FrozenFigure(1, 's')})
+
+
+def test_copy():
+    f = FrozenFigure(1, 'm')
+    assert f is copy.copy(f)
+    assert f is copy.deepcopy(f)
+
+
+@pytest.mark.parametrize(('expression', 'expected'), [
+    [lambda: FrozenFigure(1, 'm') + FrozenFigure(2, 'm'), FrozenFigure(3, 'm')],
+    [lambda: sum([FrozenFigure(1, 'm'), FrozenFigure(2, 'm')]), FrozenFigure(3, 'm')],
+    [lambda: FrozenFigure(1, 'm') - FrozenFigure(2, 'm'), FrozenFigure(-1, 'm')],
+    [lambda: FrozenFigure(2, 'm') * 3, FrozenFigure(6, 'm')],
+    [lambda: FrozenFigure(3, 'm') / 2, FrozenFigure(1.5, 'm')],
+    [lambda: abs(FrozenFigure(-3, 'm')), FrozenFigure(3, 'm')],
+])
+def test_arithmetic(expression, expected):
+    result = expression()
+    assert FrozenFigure == type(result)
+    assert expected == result
+
+
+def test_yaml():
+    class TestDumper(yaml.SafeDumper):
+        pass
+    FrozenFigure.register_yaml_representer(TestDumper)
+    generated_yaml = yaml.dump([FrozenFigure(1.5, 'm'), FrozenFigure([1], 's')], Dumper=TestDumper)
+    assert "- !figure '1.5 m'\n- !figure\n  unit: s\n  value:\n  - 1\n" == generated_yaml
+
+    class TestLoader(yaml.SafeLoader):
+        pass
+    FrozenFigure.register_yaml_constructor(TestLoader)
+    loaded = yaml.load(generated_yaml, Loader=TestLoader)
+    assert [FrozenFigure(1.5, 'm'), FrozenFigure([1], 's')] == loaded
+    assert all(type(f) is FrozenFigure for f in loaded)
+
+
+@pytest.mark.parametrize(('a', 'b', 'expected'), [
+    [FrozenFigure(1, 'm'), FrozenFigure(1, 'm'), True],
+    [FrozenFigure(1, 'm'), Figure(1, 'm'), True],
+    [FrozenFigure(1, 'm'), FrozenFigure(1, 's'), False],
+    [FrozenFigure(1, 'm'), Figure(2, 'm'), False],
+    [FrozenFigure([1], 'm'), Figure([1], 'm'), True],
+    [FrozenFigure(1, 'm'), (1, 'm'), False],
+    [FrozenFigure(None), None, False],
+])
+def test_eq_symmetric(a, b, expected):
+    assert expected == (a == b)
+    assert expected == (b == a)
+    assert expected != (a != b)
+    assert expected != (b != a)
+
+
+def test_hash_cached():
+    f = FrozenFigure(1.5, 'm')
+    assert hash((1.5, 'm')) == hash(f)
+    assert hash(f) == f._hash
+    assert hash(f) == hash(FrozenFigure(1.5, u'm'))
+    with pytest.raises(TypeError):
+        hash(FrozenFigure([1], 'm'))
+
+
+def test_no_instance_dict():
+    f = FrozenFigure(1, 'm')
+    f.value, f.unit, hash(f), f == FrozenFigure(1, 'm')
+    assert not hasattr(f, '__dict__')
+    with pytest.raises(AttributeError):
+        f.foo = 3
+    assert FrozenFigure(1, 'm') == f
+
+
+def test_size():
+    sys = pytest.importorskip('sys')
+    assert sys.getsizeof(FrozenFigure(1, 'm')) <= sys.getsizeof(Figure(1, 'm')) + 8
+
+
+def test_pickle():
+    pickle = pytest.importorskip('pickle')
+    f = FrozenFigure(1.5, u'm/s²')
+    assert f == pickle.loads(pickle.dumps(f))
+    assert type(f) is type(pickle.loads(pickle.dumps(f)))
+
+
+def test_intern_figures():
+    figures = [Figure(1, 'm'), FrozenFigure(1, 'm'), Figure(2, 'm'), Figure([1], 'm'), Figure(1, 'm')]
+    interned = ioex.calcex.intern_figures(figures)
+    assert figures == interned
+    assert all(type(f) is FrozenFigure for f in interned)
+    assert interned[0] is interned[1] is interned[4]
+    frozen = FrozenFigure(5, 'm')
+    assert frozen is ioex.calcex.intern_figures([frozen])[0]
+    table = {}
+    a = ioex.calcex.intern_figures([Figure(3, 's')], table)
+    b = ioex.calcex.intern_figures(iter([FrozenFigure(3, 's')]), table)
+    assert a[0] is b[0]
+
+
+def test_unique_figures():
+    figures = [Figure(1, 'm'), FrozenFigure(1, 'm'), Figure(2, 'm'), Figure([1], 'm'),
+               Figure([1], 'm'), Figure(1, 's'), Figure(2, 'm')]
+    unique = ioex.calcex.unique_figures(figures)
+    assert [Figure(1, 'm'), Figure(2, 'm'), Figure([1], 'm'), Figure(1, 's')] == unique
+    assert unique[0] is figures[0]
+    assert [] == ioex.calcex.unique_figures([])
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from ioex.calcex import Figure, FigureArray, UnitRegistry, \
+    UnitMismatchError, UnknownUnitError
+
+
+@pytest.fixture
+def units():
+    registry = UnitRegistry()
+    registry.define('m')
+    registry.define_prefixes('m')
+    registry.define('g')
+    registry.define_prefixes('g')
+    registry.define('s')
+    registry.define('min', 60, 's')
+    registry.define('h', 60, 'min')
+    registry.define('N', 1000, 'g*m/s²')
+    registry.define('l', 1, 'dm^3')
+    registry.define('ft', 0.3048, 'm')
+    return registry
+
+
+@pytest.mark.parametrize(('from_unit', 'to_unit', 'expected_factor'), [
+    [None, None, 1],
+    ['m', 'm', 1],
+    ['km', 'm', 1000],
+    ['m', 'km', 0.001],
+    ['μm', 'nm', 1000],
+    ['h', 's', 3600],
+    ['km/h', 'm/s', 1 / 3.6],
+    ['m/s²', 'm/(s·s)', 1],
+    ['m/s²', 'm*s^-2', 1],
+    ['m⁻¹', 'km^-1', 1000],
+    ['N', 'kg·m/s^2', 1],
+    ['l', 'm³', 0.001],
+    ['ft', 'm', 0.3048],
+])
+def test_factor(units, from_unit, to_unit, expected_factor):
+    factor = units.factor(from_unit, to_unit)
+    assert expected_factor == pytest.approx(factor)
+    assert type(expected_factor) == type(factor)
+
+
+@pytest.mark.parametrize(('from_unit', 'to_unit', 'exception_type'), [
+    ['m', 's', UnitMismatchError],
+    ['m', None, UnitMismatchError],
+    ['m/s', 'm', UnitMismatchError],
+    ['parsec', 'm', UnknownUnitError],
+    ['m', 'm/', UnknownUnitError],
+    ['(m', 'm', UnknownUnitError],
+    ['m)', 'm', UnknownUnitError],
+])
+def test_factor_fail(units, from_unit, to_unit, exception_type):
+    with pytest.raises(exception_type):
+        units.factor(from_unit, to_unit)
+
+
+def test_factor_memoized(units):
+    units.factor('km/h', 'm/s')
+    units._units.clear()
+    assert 1 / 3.6 == pytest.approx(units.factor('km/h', 'm/s'))
+
+
+def test_define_clears_cache(units):
+    assert 1000 == units.factor('km', 'm')
+    units.define('km', 1024, 'm')
+    assert 1024 == units.factor('km', 'm')
+
+
+@pytest.mark.parametrize(('figure', 'unit', 'expected_figure'), [
+    [Figure(1500, 'm'), 'km', Figure(1.5, 'km')],
+    [Figure(2, 'km'), 'm', Figure(2000, 'm')],
+    [Figure(90, 'km/h'), 'm/s', Figure(25.0, 'm/s')],
+])
+def test_convert(units, figure, unit, expected_figure):
+    assert expected_figure == units.convert(figure, unit)
+
+
+def test_convert_array(units):
+    assert FigureArray([1000, 2500], 'm') \
+        == units.convert_array(FigureArray([1, 2.5], 'km'), 'm')
+
+
+@pytest.mark.parametrize(('figures', 'unit', 'expected_sum'), [
+    [[], None, Figure(0)],
+    [[Figure(1, 'km'), Figure(500, 'm'), Figure(2, 'km')], None, Figure(3.5, 'km')],
+    [[Figure(500, 'm'), Figure(1, 'km')], None, Figure(1500, 'm')],
+    [[Figure(1, 'h'), Figure(30, 'min')], 's', Figure(5400, 's')],
+])
+def test_sum(units, figures, unit, expected_sum):
+    assert expected_sum == units.sum(figures, unit=unit)
+
+
+def test_sum_mismatch(units):
+    with pytest.raises(UnitMismatchError):
+        units.sum([Figure(1, 'm'), Figure(1, 's')])
+
+
+def test_figure_array(units):
+    assert FigureArray([1000, 5, 2000], 'm') \
+        == units.figure_array([Figure(1, 'km'), Figure(5, 'm'), Figure(2, 'km')], 'm')
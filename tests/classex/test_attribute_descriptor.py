@@ -142,3 +142,50 @@ def test_always_accept_none_default():
     with pytest.raises(TypeError):
         obj.c = None
     assert 'C' == obj._c
+
+
+def test_get_class():
+    assert isinstance(Xyzzy.desc, AttributeDescriptor)
+
+
+class Slotted(object):
+
+    __slots__ = ('_a',)
+
+    a = AttributeDescriptor('_a', types=(int,), min=0)
+
+
+class SlottedSub(Slotted):
+
+    b = AttributeDescriptor('_b', types=(int,))
+
+
+@pytest.mark.parametrize(('cls'), [Slotted, SlottedSub])
+def test_slots(cls):
+    obj = cls()
+    with pytest.raises(AttributeError):
+        obj.a
+    obj.a = 1
+    assert 1 == obj.a
+    assert 1 == obj._a
+    obj._a = 2
+    assert 2 == obj.a
+    with pytest.raises(ValueError):
+        obj.a = -1
+    assert 2 == obj.a
+
+
+def test_slots_sub_dict():
+    obj = SlottedSub()
+    obj.b = 3
+    assert 3 == obj.b
+    assert {'_b': 3} == obj.__dict__
+    with pytest.raises(TypeError):
+        obj.b = 3.0
+
+
+def test_unset():
+    obj = Xyzzy()
+    with pytest.raises(AttributeError):
+        obj.desc
+    assert not hasattr(obj, 'desc')
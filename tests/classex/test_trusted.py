@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+import ioex.classex
+from ioex.classex import AttributeDescriptor
+
+
+class Foo(object):
+
+    a = AttributeDescriptor('_a', types=(int,), min=0)
+    b = AttributeDescriptor('_b', types=(str,), always_accept_none=True)
+
+    def __init__(self, a=0, b=None):
+        self.a = a
+        self.b = b
+
+    @classmethod
+    def from_trusted(cls, a=0, b=None):
+        return ioex.classex.construct_trusted(cls, _a=a, _b=b)
+
+
+class Slotted(object):
+
+    __slots__ = ('_a',)
+
+    a = AttributeDescriptor('_a', types=(int,))
+
+    @classmethod
+    def from_trusted(cls, a=0):
+        return ioex.classex.construct_trusted(cls, _a=a)
+
+
+def test_construct_trusted():
+    obj = Foo.from_trusted(a=-1, b=2)
+    assert -1 == obj.a
+    assert 2 == obj.b
+    assert 0 == Foo.from_trusted().a
+    assert -1 == Slotted.from_trusted(a=-1).a
+
+
+@pytest.mark.parametrize(('values'), [
+    [0, 1, 2, True],
+    [],
+])
+def test_validate_many(values):
+    Foo.a.validate_many(values)
+
+
+@pytest.mark.parametrize(('descriptor', 'values', 'exception_type'), [
+    [Foo.a, [0, 1, '2'], TypeError],
+    [Foo.a, [0, 1.5], TypeError],
+    [Foo.a, [0, 3, -1], ValueError],
+    [Foo.b, ['a', None, 1], TypeError],
+    [Foo.a, [None], TypeError],
+])
+def test_validate_many_fail(descriptor, values, exception_type):
+    with pytest.raises(exception_type):
+        descriptor.validate_many(values)
+
+
+@pytest.mark.parametrize(('cls'), [Foo, Slotted])
+@pytest.mark.parametrize(('validate'), [True, False])
+def test_from_trusted_many(cls, validate):
+    rows = [{'a': 1}, {}, {'a': 3}]
+    objs = ioex.classex.from_trusted_many(cls, rows, validate=validate)
+    assert [1, 0, 3] == [obj.a for obj in objs]
+    assert all(type(obj) is cls for obj in objs)
+
+
+def test_from_trusted_many_independent():
+    objs = ioex.classex.from_trusted_many(Foo, [{'b': 'x'}, {}])
+    objs[1].a = 4
+    assert [0, 4] == [obj.a for obj in objs]
+    assert ['x', None] == [obj.b for obj in objs]
+
+
+@pytest.mark.parametrize(('rows', 'exception_type'), [
+    [[{'a': 1}, {'a': -1}], ValueError],
+    [[{'a': 1}, {'b': 2}], TypeError],
+    [[{'c': 1}], TypeError],
+])
+def test_from_trusted_many_validate_fail(rows, exception_type):
+    with pytest.raises(exception_type):
+        ioex.classex.from_trusted_many(Foo, rows, validate=True)
+
+
+def test_from_trusted_many_unknown_attribute():
+    with pytest.raises(TypeError):
+        ioex.classex.from_trusted_many(Foo, [{'c': 1}])
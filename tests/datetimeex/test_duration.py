@@ -195,3 +195,103 @@ def test_eq(a, b):
 ])
 def test_radd_datetime(src_dt, duration, expected_sum):
     assert expected_sum == src_dt + duration
+
+
+@pytest.mark.parametrize(('attr', 'value'), [
+    ['months', 2],
+    ['weeks', 3],
+    ['hours', 4],
+    ['seconds', 5],
+    ['seconds', 0.25],
+])
+def test_set_extra_fields(attr, value):
+    d = Duration(**{attr: value})
+    assert value == getattr(d, attr)
+    assert Duration(**{attr: value}) == d
+    assert Duration() != d
+
+
+@pytest.mark.parametrize(('init_kwargs', 'exception_type'), [
+    [{'months': -1}, ValueError],
+    [{'weeks': 1.5}, TypeError],
+    [{'hours': '1'}, TypeError],
+    [{'seconds': -0.5}, ValueError],
+    [{'seconds': '1'}, TypeError],
+])
+def test_init_extra_fields_fail(init_kwargs, exception_type):
+    with pytest.raises(exception_type):
+        Duration(**init_kwargs)
+
+
+@pytest.mark.parametrize(('expected', 'iso'), [
+    [Duration(months=2), 'P2M'],
+    [Duration(weeks=3), 'P3W'],
+    [Duration(hours=4), 'PT4H'],
+    [Duration(seconds=5), 'PT5S'],
+    [Duration(seconds=0.5), 'PT0.5S'],
+    [Duration(seconds=10.25), 'PT10.25S'],
+    [Duration(years=1, months=2, weeks=3, days=4, hours=5, minutes=6, seconds=7),
+     'P1Y2M3W4DT5H6M7S'],
+    [Duration(months=10, minutes=20), 'P10MT20M'],
+])
+def test_isoformat_roundtrip(expected, iso):
+    assert iso == expected.isoformat
+    assert expected == Duration.from_iso(iso)
+
+
+@pytest.mark.parametrize(('expected', 'source_iso'), [
+    [Duration(seconds=1.25), 'PT1,25S'],
+    [Duration(seconds=0.5), 'PT0.50S'],
+    [Duration(), 'PT0S'],
+])
+def test_from_iso_extra(expected, source_iso):
+    assert expected == Duration.from_iso(source_iso)
+    assert type(expected.seconds) == type(Duration.from_iso(source_iso).seconds)
+
+
+@pytest.mark.parametrize(('source_iso'), [
+    'PT',
+    'P1DT',
+    'P1.5D',
+    'PT1.5M',
+    'P1D2Y',
+    'PT1S2M',
+])
+def test_from_iso_extra_fail(source_iso):
+    with pytest.raises(ValueError):
+        Duration.from_iso(source_iso)
+
+
+def test_from_iso_cached_independent():
+    a = Duration.from_iso('P1Y')
+    b = Duration.from_iso('P1Y')
+    assert a is not b
+    a.years = 2
+    assert Duration(years=1) == Duration.from_iso('P1Y')
+
+
+@pytest.mark.parametrize(('src_dt', 'duration', 'expected_sum'), [
+    [
+        datetime.datetime(2016, 1, 31, 21, 7, 1),
+        Duration(months=1),
+        datetime.datetime(2016, 2, 29, 21, 7, 1),
+    ],
+    [
+        datetime.datetime(2016, 1, 31, 21, 7, 1),
+        Duration(weeks=2, hours=3, seconds=1.5),
+        datetime.datetime(2016, 2, 15, 0, 7, 2, 500000),
+    ],
+])
+def test_radd_datetime_extra_fields(src_dt, duration, expected_sum):
+    assert expected_sum == src_dt + duration
+
+
+def test_isoformat_negligible_seconds():
+    assert 'P1D' == Duration(days=1, seconds=1e-9).isoformat
+
+
+def test_format_many():
+    durations = [Duration(years=1), Duration(days=2, seconds=0.5), Duration(years=1), Duration()]
+    assert ['P1Y', 'P2DT0.5S', 'P1Y', 'P0Y'] == Duration.format_many(durations)
+    assert [] == Duration.format_many([])
+    assert ['PT3M'] == Duration.format_many(d for d in [Duration(minutes=3)])
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from ioex.datetimeex import Duration
+import datetime
+import pytz
+
+datetimes = [
+    datetime.datetime(2016, 2, 29, 21, 7, 1),
+    datetime.datetime(2016, 1, 31, 0, 0, 0, 123456),
+    datetime.datetime(2015, 12, 31, 23, 59, 59),
+    datetime.datetime(2017, 5, 19, 21, 7, 1),
+]
+
+durations = [
+    Duration(),
+    Duration(years=1),
+    Duration(months=1),
+    Duration(years=1, days=6, minutes=18),
+    Duration(months=13, weeks=2, hours=25, seconds=1.5),
+    Duration(minutes=90),
+]
+
+
+@pytest.mark.parametrize(('duration'), durations)
+def test_add_to_list(duration):
+    assert [dt + duration for dt in datetimes] == duration.add_to(datetimes)
+
+
+def test_add_to_aware():
+    dts = [pytz.utc.localize(dt) for dt in datetimes]
+    assert [dt + Duration(months=1) for dt in dts] == Duration(months=1).add_to(iter(dts))
+
+
+def test_add_to_fail():
+    with pytest.raises(TypeError):
+        Duration(days=1).add_to([datetime.date(2016, 1, 1)])
+
+
+@pytest.mark.parametrize(('duration'), durations)
+def test_add_to_datetime64(duration):
+    numpy = pytest.importorskip('numpy')
+    values = numpy.array(datetimes, dtype='datetime64[us]')
+    shifted = duration.add_to(values)
+    assert isinstance(shifted, numpy.ndarray)
+    assert numpy.dtype('datetime64[us]') == shifted.dtype
+    assert [dt + duration for dt in datetimes] == shifted.tolist()
+
+
+@pytest.mark.parametrize(('duration', 'dates', 'expected_dates'), [
+    [Duration(months=1), ['2016-01-31', '2016-03-31', 'NaT'], ['2016-02-29', '2016-04-30', 'NaT']],
+    [Duration(years=1), ['2016-02-29', '2015-02-28'], ['2017-02-28', '2016-02-28']],
+    [Duration(years=4), ['2016-02-29'], ['2020-02-29']],
+])
+def test_add_to_datetime64_clamp(duration, dates, expected_dates):
+    numpy = pytest.importorskip('numpy')
+    shifted = duration.add_to(numpy.array(dates, dtype='datetime64[D]'))
+    assert numpy.array_equal(
+        numpy.array(expected_dates, dtype='datetime64[D]'),
+        shifted,
+        equal_nan=True,
+    )
+
+
+def test_add_to_datetime64_fail():
+    numpy = pytest.importorskip('numpy')
+    with pytest.raises(TypeError):
+        Duration(days=1).add_to(numpy.array([1, 2]))
@@ -60,3 +60,19 @@ def test_to_yaml(duration, yaml_string, dumper):
         Dumper=TestDumper,
         default_flow_style=False,
     )
+
+
+@pytest.mark.parametrize(('duration'), [
+    Duration(months=2, weeks=1),
+    Duration(hours=3, seconds=4.5),
+    Duration(years=1, months=2, weeks=3, days=4, hours=5, minutes=6, seconds=7),
+])
+def test_yaml_roundtrip_extra_fields(duration):
+    class TestDumper(yaml.SafeDumper):
+        pass
+    Duration.register_yaml_representer(TestDumper)
+
+    class TestLoader(yaml.SafeLoader):
+        pass
+    Duration.register_yaml_constructor(TestLoader)
+    assert duration == yaml.load(yaml.dump(duration, Dumper=TestDumper), Loader=TestLoader)
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+import datetime
+from ioex.datetimeex import Duration, Period
+
+
+@pytest.mark.parametrize(('kwargs'), [
+    {},
+    {'years': 1, 'days': 3},
+    {'months': 2, 'weeks': 1, 'hours': 5, 'minutes': 6, 'seconds': 7.5},
+])
+def test_duration_from_trusted(kwargs):
+    assert Duration(**kwargs) == Duration.from_trusted(**kwargs)
+    assert Duration(**kwargs).isoformat == Duration.from_trusted(**kwargs).isoformat
+
+
+@pytest.mark.parametrize(('kwargs'), [
+    {},
+    {'start': datetime.datetime(2016, 7, 24, 12, 21)},
+    {'start': datetime.datetime(2016, 7, 24, 12, 21), 'end': datetime.datetime(2016, 7, 24, 12, 22)},
+])
+def test_period_from_trusted(kwargs):
+    assert Period(**kwargs) == Period.from_trusted(**kwargs)
+
+
+@pytest.mark.parametrize(('validate'), [True, False])
+def test_from_trusted_many(validate):
+    rows = [{'years': 1}, {'days': 2, 'seconds': 0.5}, {}]
+    assert [Duration(**row) for row in rows] \
+        == Duration.from_trusted_many(rows, validate=validate)
+    rows = [{'start': datetime.datetime(2016, 7, 24)}, {}]
+    assert [Period(**row) for row in rows] \
+        == Period.from_trusted_many(iter(rows), validate=validate)
+
+
+@pytest.mark.parametrize(('rows', 'exception_type'), [
+    [[{'years': 1}, {'days': -2}], ValueError],
+    [[{'years': 1}, {'seconds': '1'}], TypeError],
+])
+def test_duration_from_trusted_many_validate_fail(rows, exception_type):
+    with pytest.raises(exception_type):
+        Duration.from_trusted_many(rows, validate=True)
+    assert len(rows) == len(Duration.from_trusted_many(rows))
+
+
+def test_period_from_trusted_many_validate_fail():
+    with pytest.raises(TypeError):
+        Period.from_trusted_many([{'start': '2016-07-24'}], validate=True)
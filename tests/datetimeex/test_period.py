@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import pytest
 
+import dateutil.parser
 import pytz
 import ioex.datetimeex
 import datetime
@@ -170,6 +171,28 @@ def test_from_iso_fail(source_iso):
         ioex.datetimeex.Period.from_iso(source_iso)
 
 
+@pytest.mark.parametrize(('source_iso'), [
+    '2016-07-24T12:21:00/2016-07-24T12:22:13',
+    '2016-07-24T12:21:00Z/2016-07-24T12:22:13+00:00',
+    '2016-07-24T12:21:00.1234567-05:30/2016-07-24T12:22:13.5+02:00',
+    '2016-07-24T12:21:00.123+14:00/2016-07-24T12:22:13.000001-00:30',
+])
+def test_from_iso_dateutil_equivalent(source_iso):
+    p = ioex.datetimeex.Period.from_iso(source_iso)
+    start, end = [dateutil.parser.parse(t) for t in source_iso.split('/')]
+    assert start == p.start
+    assert start.utcoffset() == p.start.utcoffset()
+    assert end == p.end
+    assert end.utcoffset() == p.end.utcoffset()
+
+
+def test_from_iso_shared_tzinfo():
+    a = ioex.datetimeex.Period.from_iso('2016-07-24T12:21:00+02:00/2016-07-24T12:22:13Z')
+    b = ioex.datetimeex.Period.from_iso('2016-07-25T12:21:00+02:00/2016-07-25T12:22:13Z')
+    assert a.start.tzinfo is b.start.tzinfo
+    assert a.end.tzinfo is b.end.tzinfo
+
+
 @pytest.mark.parametrize(('a', 'b'), [
     [
         ioex.datetimeex.Period(
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+import datetime
+import random
+from ioex.datetimeex import Period, PeriodIndex
+
+
+def period(start_hour, end_hour):
+    base = datetime.datetime(2017, 1, 1)
+    return Period(
+        start=base + datetime.timedelta(hours=start_hour),
+        end=base + datetime.timedelta(hours=end_hour),
+    )
+
+
+def hour(h):
+    return datetime.datetime(2017, 1, 1) + datetime.timedelta(hours=h)
+
+
+periods = [period(0, 4), period(2, 3), period(3, 8), period(5, 6), period(9, 9)]
+
+
+@pytest.mark.parametrize(('dt', 'expected'), [
+    [hour(-1), []],
+    [hour(0), [period(0, 4)]],
+    [hour(2), [period(0, 4), period(2, 3)]],
+    [hour(3), [period(0, 4), period(3, 8)]],
+    [hour(8), []],
+    [hour(9), []],
+])
+def test_at(dt, expected):
+    assert expected == PeriodIndex(periods).at(dt)
+
+
+@pytest.mark.parametrize(('query', 'method', 'expected'), [
+    [period(4, 5), 'overlapping', [period(3, 8)]],
+    [period(1, 3), 'overlapping', [period(0, 4), period(2, 3)]],
+    [period(8, 9), 'overlapping', []],
+    [period(2, 3), 'enclosing', [period(0, 4), period(2, 3)]],
+    [period(5, 7), 'enclosing', [period(3, 8)]],
+    [period(1, 9), 'enclosing', []],
+    [period(2, 8), 'within', [period(2, 3), period(3, 8), period(5, 6)]],
+    [period(5, 9), 'within', [period(5, 6), period(9, 9)]],
+])
+def test_query(query, method, expected):
+    assert expected == getattr(PeriodIndex(periods), method)(query)
+
+
+def test_insert_remove():
+    index = PeriodIndex()
+    assert 0 == len(index)
+    for p in reversed(periods):
+        index.insert(p)
+    assert periods == list(index)
+    assert [period(0, 4), period(2, 3)] == index.at(hour(2))
+    index.remove(period(2, 3))
+    assert period(2, 3) not in index
+    assert [period(0, 4)] == index.at(hour(2))
+    index.insert(period(1, 2))
+    assert [period(0, 4), period(1, 2)] == index.at(hour(1))
+    with pytest.raises(ValueError):
+        index.remove(period(2, 3))
+
+
+@pytest.mark.parametrize(('period', 'exception_type'), [
+    [(hour(0), hour(1)), TypeError],
+    [Period(start=hour(0)), ValueError],
+    [Period(end=hour(0)), ValueError],
+    [period(2, 1), ValueError],
+])
+def test_insert_fail(period, exception_type):
+    with pytest.raises(exception_type):
+        PeriodIndex([period])
+    with pytest.raises(exception_type):
+        PeriodIndex().insert(period)
+
+
+@pytest.mark.parametrize(('size'), [1, 2, 15, 16, 17, 100, 1000])
+def test_brute_force(size):
+    rand = random.Random(size)
+    indexed = [period(s, s + rand.randint(0, 40)) for s in (rand.randint(0, 500) for _ in range(size))]
+    index = PeriodIndex(indexed)
+    for _ in range(50):
+        start = rand.randint(-10, 510)
+        query = period(start, start + rand.randint(0, 40))
+        assert [p for p in index if p.start <= query.start < p.end] == index.at(query.start)
+        assert [p for p in index if p.start < query.end and query.start < p.end] \
+            == index.overlapping(query)
+        assert [p for p in index if p.start <= query.start and query.end <= p.end] \
+            == index.enclosing(query)
+        assert [p for p in index if query.start <= p.start and p.end <= query.end] \
+            == index.within(query)
+        index.insert(query)
+        index.remove(rand.choice(list(index)))
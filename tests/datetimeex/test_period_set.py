@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+import datetime
+import random
+from ioex.datetimeex import Period, PeriodSet
+
+
+def hour(h):
+    return datetime.datetime(2017, 1, 1) + datetime.timedelta(hours=h)
+
+
+def period(start_hour, end_hour):
+    return Period(start=hour(start_hour), end=hour(end_hour))
+
+
+def period_set(*bounds):
+    return PeriodSet([period(s, e) for s, e in bounds])
+
+
+@pytest.mark.parametrize(('periods', 'expected_periods'), [
+    [[], []],
+    [[period(0, 1)], [period(0, 1)]],
+    [[period(2, 3), period(0, 1)], [period(0, 1), period(2, 3)]],
+    [[period(0, 2), period(1, 3)], [period(0, 3)]],
+    [[period(0, 1), period(1, 2)], [period(0, 2)]],
+    [[period(0, 5), period(1, 2), period(6, 6)], [period(0, 5)]],
+])
+def test_init_normalize(periods, expected_periods):
+    assert expected_periods == PeriodSet(periods).periods
+
+
+@pytest.mark.parametrize(('periods', 'exception_type'), [
+    [[(hour(0), hour(1))], TypeError],
+    [[Period(start=hour(0))], ValueError],
+    [[period(3, 2)], ValueError],
+    [[period(0, 1), period(3, 2)], ValueError],
+])
+def test_init_fail(periods, exception_type):
+    with pytest.raises(exception_type):
+        PeriodSet(periods)
+
+
+@pytest.mark.parametrize(('dt', 'expected'), [
+    [hour(-1), False],
+    [hour(0), True],
+    [hour(1), False],
+    [hour(2), True],
+    [hour(3), True],
+    [hour(4), False],
+])
+def test_contains(dt, expected):
+    assert expected == (dt in period_set((0, 1), (2, 4)))
+
+
+@pytest.mark.parametrize(('a', 'b', 'union', 'intersection', 'difference'), [
+    [period_set(), period_set((0, 1)), period_set((0, 1)), period_set(), period_set()],
+    [period_set((0, 8)), period_set((2, 3), (5, 6)),
+     period_set((0, 8)), period_set((2, 3), (5, 6)), period_set((0, 2), (3, 5), (6, 8))],
+    [period_set((0, 2), (4, 6)), period_set((1, 5)),
+     period_set((0, 6)), period_set((1, 2), (4, 5)), period_set((0, 1), (5, 6))],
+    [period_set((0, 1)), period_set((1, 2)), period_set((0, 2)), period_set(), period_set((0, 1))],
+    [period_set((2, 3)), period_set((0, 9)), period_set((0, 9)), period_set((2, 3)), period_set()],
+])
+def test_operations(a, b, union, intersection, difference):
+    assert union == a | b
+    assert union == b | a
+    assert intersection == a & b
+    assert intersection == b & a
+    assert difference == a - b
+
+
+@pytest.mark.parametrize(('seed'), range(8))
+def test_brute_force(seed):
+    rand = random.Random(seed)
+
+    def random_set():
+        bounds = []
+        for _ in range(rand.randint(0, 20)):
+            start = rand.randint(0, 100)
+            bounds.append((start, start + rand.randint(0, 10)))
+        return period_set(*bounds), set(h for s, e in bounds for h in range(s, e))
+
+    def hours(s):
+        return set(h for p in s for h in range(
+            int((p.start - hour(0)).total_seconds()) // 3600,
+            int((p.end - hour(0)).total_seconds()) // 3600,
+        ))
+
+    a, a_hours = random_set()
+    b, b_hours = random_set()
+    assert a_hours | b_hours == hours(a | b)
+    assert a_hours & b_hours == hours(a & b)
+    assert a_hours - b_hours == hours(a - b)
+    for result in [a | b, a & b, a - b]:
+        periods = result.periods
+        assert all(x.end < y.start for x, y in zip(periods, periods[1:]))
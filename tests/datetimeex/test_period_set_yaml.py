@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+import datetime
+from ioex.datetimeex import Period, PeriodSet
+yaml = pytest.importorskip('yaml')
+
+period_set = PeriodSet([
+    Period(start=datetime.datetime(2017, 1, 1, 9), end=datetime.datetime(2017, 1, 1, 17)),
+    Period(start=datetime.datetime(2017, 1, 2, 9), end=datetime.datetime(2017, 1, 2, 17)),
+])
+
+
+@pytest.mark.parametrize(('loader'), [yaml.Loader, yaml.SafeLoader])
+def test_from_yaml(loader):
+    class TestLoader(loader):
+        pass
+    PeriodSet.register_yaml_constructor(TestLoader)
+    yaml_string = '\n'.join([
+        '!periodset',
+        '- !period',
+        '  start: 2017-01-02T09:00:00',
+        '  end: 2017-01-02T17:00:00',
+        '- !period',
+        '  start: 2017-01-01T09:00:00',
+        '  end: 2017-01-01T12:00:00',
+        '- !period',
+        '  start: 2017-01-01T12:00:00',
+        '  end: 2017-01-01T17:00:00',
+    ])
+    assert period_set == yaml.load(yaml_string, Loader=TestLoader)
+
+
+@pytest.mark.parametrize(('dumper'), [yaml.Dumper, yaml.SafeDumper])
+def test_to_yaml(dumper):
+    class TestDumper(dumper):
+        pass
+    PeriodSet.register_yaml_representer(TestDumper)
+    assert '\n'.join([
+        '!periodset',
+        '- !period',
+        '  end: 2017-01-01 17:00:00',
+        '  start: 2017-01-01 09:00:00',
+        '- !period',
+        '  end: 2017-01-02 17:00:00',
+        '  start: 2017-01-02 09:00:00',
+        '',
+    ]) == yaml.dump(period_set, Dumper=TestDumper, default_flow_style=False)
+
+
+def test_yaml_roundtrip():
+    class TestDumper(yaml.SafeDumper):
+        pass
+    PeriodSet.register_yaml_representer(TestDumper)
+
+    class TestLoader(yaml.SafeLoader):
+        pass
+    PeriodSet.register_yaml_constructor(TestLoader)
+    for s in [PeriodSet(), period_set]:
+        assert s == yaml.load(yaml.dump(s, Dumper=TestDumper), Loader=TestLoader)
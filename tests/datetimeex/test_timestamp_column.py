@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+import datetime
+import dateutil.tz.tz
+import ioex.datetimeex
+from ioex.datetimeex import TimestampColumn
+yaml = pytest.importorskip('yaml')
+
+
+def column_loader():
+    class TestLoader(yaml.SafeLoader):
+        pass
+    ioex.datetimeex.register_yaml_timestamp_column_constructor(TestLoader)
+    return TestLoader
+
+
+@pytest.mark.parametrize(('yaml_string'), [
+    '[2016-07-14 13:50:04, 2016-07-14T13:50:04.5, 1970-01-01 00:00:00, 1969-12-31 23:59:59.999999]',
+    '[2016-07-14 13:50:04Z, 2016-07-14 13:50:04.25+02:00, 2016-07-14 13:50:04 -5]',
+    '- 2016-07-14 13:50:04.1234567+05:30\n- 2016-02-29 00:00:00-00:30',
+])
+def test_from_yaml_column(yaml_string):
+    loaded = yaml.load(yaml_string, Loader=column_loader())
+    assert isinstance(loaded, TimestampColumn)
+    expected = yaml.load(yaml_string, Loader=yaml.SafeLoader)
+    assert expected == list(loaded)
+    assert [dt.utcoffset() for dt in expected] == [dt.utcoffset() for dt in loaded]
+    assert TimestampColumn.from_datetimes(expected) == loaded
+
+
+@pytest.mark.parametrize(('yaml_string', 'expected'), [
+    ['[]', []],
+    ['[2016-07-14]', [datetime.date(2016, 7, 14)]],
+    ['[2016-07-14 13:50:04, 1]', [datetime.datetime(2016, 7, 14, 13, 50, 4), 1]],
+    ['[2016-07-14 13:50:04, 2016-07-14 13:50:04Z]', [
+        datetime.datetime(2016, 7, 14, 13, 50, 4),
+        datetime.datetime(2016, 7, 14, 13, 50, 4, tzinfo=dateutil.tz.tz.tzutc()),
+    ]],
+    ["['2016-07-14 13:50:04']", ['2016-07-14 13:50:04']],
+    ['[[a], {b: c}]', [['a'], {'b': 'c'}]],
+])
+def test_from_yaml_list(yaml_string, expected):
+    loaded = yaml.load(yaml_string, Loader=column_loader())
+    assert type(loaded) is list
+    assert expected == loaded
+
+
+def test_from_yaml_nested_alias():
+    loaded = yaml.load(
+        'a: &times [2016-07-14 13:50:04Z]\nb: *times',
+        Loader=column_loader(),
+    )
+    assert isinstance(loaded['a'], TimestampColumn)
+    assert loaded['a'] is loaded['b']
+
+
+def test_from_yaml_shared_tzinfo():
+    loaded = yaml.load('[2016-07-14 13:50:04+02:00, 2017-07-14 13:50:04+02:00]', Loader=column_loader())
+    assert loaded[0].tzinfo is loaded[1].tzinfo
+    assert loaded[-1] == loaded[1]
+
+
+def test_from_datetimes_fail():
+    with pytest.raises(TypeError):
+        TimestampColumn.from_datetimes([datetime.date(2016, 7, 14)])
+    with pytest.raises(ValueError):
+        TimestampColumn.from_datetimes([
+            datetime.datetime(2016, 7, 14),
+            datetime.datetime(2016, 7, 14, tzinfo=dateutil.tz.tz.tzutc()),
+        ])
+
+
+def test_init_fail():
+    with pytest.raises(ValueError):
+        TimestampColumn([1, 2], [0])
+
+
+def test_to_numpy():
+    numpy = pytest.importorskip('numpy')
+    loaded = yaml.load('[2016-07-14 13:50:04.5+02:00, 2016-07-14 13:50:04Z]', Loader=column_loader())
+    assert numpy.array_equal(
+        numpy.array(['2016-07-14T11:50:04.5', '2016-07-14T13:50:04'], dtype='datetime64[us]'),
+        loaded.to_numpy(),
+    )
+    assert [7200, 0] == list(loaded.offsets)
+
+
+def test_to_yaml_roundtrip():
+    class TestDumper(yaml.SafeDumper):
+        pass
+    TimestampColumn.register_yaml_representer(TestDumper)
+    column = TimestampColumn.from_datetimes([
+        datetime.datetime(2016, 7, 14, 13, 50, 4, tzinfo=dateutil.tz.tz.tzoffset(None, 3600)),
+    ])
+    dumped = yaml.dump(column, Dumper=TestDumper)
+    assert column == yaml.load(dumped, Loader=column_loader())
@@ -52,3 +52,37 @@ def test_from_yaml_repeat(yaml_string, expected_timestamp):
     assert yaml.load(yaml_string, Loader = TestLoader) == expected_timestamp
     ioex.datetimeex.register_yaml_timestamp_constructor(TestLoader)
     assert yaml.load(yaml_string, Loader = TestLoader) == expected_timestamp
+
+@pytest.mark.parametrize(('yaml_string'), [
+    '2016-07-14',
+    '2016-7-4 3:50:04',
+    '2016-07-14t13:50:04.5',
+    '2016-07-14 13:50:04.1234567',
+    '2016-07-14T13:50:04.000013Z',
+    '2016-07-14 13:50:04 -5',
+    '2016-07-14 13:50:04.25 +05:30',
+    '2016-07-14  13:50:04+00:00',
+    ])
+def test_from_yaml_pyyaml_equivalent(yaml_string):
+    class TestLoader(yaml.SafeLoader):
+        pass
+    ioex.datetimeex.register_yaml_timestamp_constructor(TestLoader)
+    loaded_timestamp = yaml.load(yaml_string, Loader = TestLoader)
+    expected_timestamp = yaml.load(yaml_string, Loader = yaml.SafeLoader)
+    assert type(expected_timestamp) == type(loaded_timestamp)
+    assert expected_timestamp == loaded_timestamp
+    if isinstance(expected_timestamp, datetime.datetime):
+        assert expected_timestamp.utcoffset() == loaded_timestamp.utcoffset()
+        assert expected_timestamp.tzname() == loaded_timestamp.tzname()
+
+def test_from_yaml_shared_tzinfo():
+    class TestLoader(yaml.SafeLoader):
+        pass
+    ioex.datetimeex.register_yaml_timestamp_constructor(TestLoader)
+    loaded = yaml.load(
+        '[2016-07-14 13:50:04Z, 2016-07-15 13:50:04Z, 2016-07-14 13:50:04+02:00, 2017-01-01 00:00:00+02:00]',
+        Loader = TestLoader,
+    )
+    assert loaded[0].tzinfo is loaded[1].tzinfo
+    assert loaded[2].tzinfo is loaded[3].tzinfo
+    assert isinstance(loaded[2].tzinfo, dateutil.tz.tz.tzoffset)
@@ -67,3 +67,333 @@ def test_file_input_output_same(tmpdir):
     assert stdout == b''
     assert stderr == b''
     assert 'b: 3\n' == io_file.read()
+
+@pytest.mark.parametrize(('stdin', 'params', 'expected_stdout'), [
+    [b'a: b\n', [], b'a: b\n'],
+    [b'{a: b}\n---\n[a, b]\n', [], b'a: b\n---\n- a\n- b\n'],
+    [b'--- 1\n--- {c: [d]}\n--- null\n', [], b'1\n---\nc:\n- d\n--- null\n...\n'],
+    [b'--- 1\n--- {c: [d]}\n--- null\n', ['--no-libyaml'], b'1\n---\nc:\n- d\n--- null\n...\n'],
+    ])
+def test_stream(stdin, params, expected_stdout):
+    p = subprocess.Popen(
+            [script_path, '--stream'] + params,
+            stdin = subprocess.PIPE,
+            stdout = subprocess.PIPE,
+            )
+    stdout, stderr = p.communicate(stdin)
+    assert expected_stdout == stdout
+
+def test_stream_file_input_output(tmpdir):
+    input_file = tmpdir.join('in')
+    input_file.write('c: d\n---\ne: f\n')
+    output_file = tmpdir.join('out')
+    subprocess.check_call(
+            [script_path, '--stream', '-i', input_file.strpath, '-o', output_file.strpath],
+            )
+    assert 'c: d\n---\ne: f\n' == output_file.read()
+
+def test_stream_file_input_output_same(tmpdir):
+    io_file = tmpdir.join('io')
+    io_file.write('{b: 3}')
+    p = subprocess.Popen(
+            [script_path, '--stream', '-i', io_file.strpath, '-o', io_file.strpath],
+            stdout = subprocess.PIPE,
+            stderr = subprocess.PIPE,
+            )
+    stdout, stderr = p.communicate()
+    assert p.returncode != 0
+    assert '{b: 3}' == io_file.read()
+
+def test_multiple_input_output_pairs(tmpdir):
+    tmpdir.join('a').write('{a: 1}')
+    tmpdir.join('b').write('[b]')
+    subprocess.check_call([
+        script_path,
+        '-i', tmpdir.join('a').strpath, '-o', tmpdir.join('a.out').strpath,
+        '-i', tmpdir.join('b').strpath, '-o', tmpdir.join('b.out').strpath,
+        ])
+    assert 'a: 1\n' == tmpdir.join('a.out').read()
+    assert '- b\n' == tmpdir.join('b.out').read()
+
+@pytest.mark.parametrize(('params'), [
+    ['-i', 'a', '-o', 'a.out', '-i', 'b'],
+    ['-i', 'a', '-i', 'b'],
+    ['dir'],
+    ['missing*.yml', '--output-dir', 'out'],
+    ['-i', 'a', '-o', 'out/x', '-i', 'b', '-o', 'out/x'],
+    ['-j', '4'],
+    ['--output-dir', 'out'],
+    ['-o', 'out/x', '-j', '2'],
+    ['-i', 'a', '-j', '0'],
+    ['dir', '--output-dir', 'out', '-j', '-1'],
+    ])
+def test_batch_usage_error(tmpdir, params):
+    tmpdir.join('a').write('a: 1')
+    tmpdir.join('b').write('b: 2')
+    tmpdir.mkdir('dir').join('c.yml').write('c: 3')
+    p = subprocess.Popen(
+            [script_path] + params,
+            cwd = tmpdir.strpath,
+            stdout = subprocess.PIPE,
+            stderr = subprocess.PIPE,
+            )
+    stdout, stderr = p.communicate()
+    assert 2 == p.returncode
+    assert b'' == stdout
+
+@pytest.mark.parametrize(('jobs'), ['1', '3'])
+def test_directory_and_glob(tmpdir, jobs):
+    src = tmpdir.mkdir('src')
+    src.join('a.yml').write('{a: 1}')
+    src.mkdir('sub').join('b.yaml').write('[b]')
+    src.join('ignored.txt').write('{c: 3}')
+    tmpdir.join('d.yml').write('{d: [4]}')
+    subprocess.check_call(
+        [script_path, 'src', '*.yml', '--output-dir', 'out', '-j', jobs],
+        cwd = tmpdir.strpath,
+        )
+    out = tmpdir.join('out')
+    assert 'a: 1\n' == out.join('a.yml').read()
+    assert '- b\n' == out.join('sub', 'b.yaml').read()
+    assert 'd:\n- 4\n' == out.join('d.yml').read()
+    assert ['a.yml', 'd.yml', 'sub'] == sorted(p.basename for p in out.listdir())
+
+def test_files_from(tmpdir):
+    tmpdir.join('a').write('{a: 1}')
+    tmpdir.join('b').write('[b]')
+    tmpdir.join('list').write('a\n\nb\tb.out\n')
+    subprocess.check_call(
+        [script_path, '--files-from', 'list', '--output-dir', 'out'],
+        cwd = tmpdir.strpath,
+        )
+    assert 'a: 1\n' == tmpdir.join('out', 'a').read()
+    assert '- b\n' == tmpdir.join('b.out').read()
+    p = subprocess.Popen(
+            [script_path, '--files-from', '-'],
+            cwd = tmpdir.strpath,
+            stdin = subprocess.PIPE,
+            )
+    p.communicate(b'a\ta\n')
+    assert 0 == p.returncode
+    assert 'a: 1\n' == tmpdir.join('a').read()
+
+def test_batch_error_keeps_output(tmpdir):
+    tmpdir.join('good').write('{a: 1}')
+    tmpdir.join('bad').write('{a: [}')
+    tmpdir.join('bad.out').write('previous')
+    p = subprocess.Popen(
+            [script_path,
+             '-i', 'bad', '-o', 'bad.out',
+             '-i', 'good', '-o', 'good.out'],
+            cwd = tmpdir.strpath,
+            stderr = subprocess.PIPE,
+            )
+    stdout, stderr = p.communicate()
+    assert 1 == p.returncode
+    assert stderr.startswith(b'bad: ')
+    assert 'previous' == tmpdir.join('bad.out').read()
+    assert 'a: 1\n' == tmpdir.join('good.out').read()
+    assert ['bad', 'bad.out', 'good', 'good.out'] == sorted(p.basename for p in tmpdir.listdir())
+
+def test_output_mode_kept(tmpdir):
+    io_file = tmpdir.join('io')
+    io_file.write('{b: 3}')
+    io_file.chmod(0o640)
+    subprocess.check_call([script_path, '-i', io_file.strpath, '-o', io_file.strpath])
+    assert 'b: 3\n' == io_file.read()
+    assert 0o640 == io_file.stat().mode & 0o777
+
+@pytest.mark.parametrize(('libyaml_params'), [[], ['--no-libyaml']])
+def test_in_place(tmpdir, libyaml_params):
+    tmpdir.join('changed').write('{a: [1]}')
+    tmpdir.join('normalized').write('a:\n- 1\n')
+    tmpdir.join('empty').write('')
+    os.utime(tmpdir.join('normalized').strpath, (0, 0))
+    os.utime(tmpdir.join('empty').strpath, (0, 0))
+    inode = tmpdir.join('normalized').stat().ino
+    subprocess.check_call(
+        [script_path, '--in-place', '-i', 'changed', '-i', 'normalized', '-i', 'empty']
+            + libyaml_params,
+        cwd = tmpdir.strpath,
+        )
+    assert 'a:\n- 1\n' == tmpdir.join('changed').read()
+    assert 'a:\n- 1\n' == tmpdir.join('normalized').read()
+    assert 0 == tmpdir.join('normalized').stat().mtime
+    assert inode == tmpdir.join('normalized').stat().ino
+    assert 'null\n...\n' == tmpdir.join('empty').read()
+    assert ['changed', 'empty', 'normalized'] == sorted(p.basename for p in tmpdir.listdir())
+
+@pytest.mark.parametrize(('jobs'), ['1', '2'])
+def test_in_place_directory(tmpdir, jobs):
+    src = tmpdir.mkdir('src')
+    src.join('a.yml').write('{a: 1}')
+    src.mkdir('sub').join('b.yaml').write('[b]')
+    src.join('ignored.txt').write('{c: 3}')
+    tmpdir.join('list').write('src/ignored.txt\n')
+    subprocess.check_call(
+        [script_path, '--in-place', 'src', '--files-from', 'list', '-j', jobs],
+        cwd = tmpdir.strpath,
+        )
+    assert 'a: 1\n' == src.join('a.yml').read()
+    assert '- b\n' == src.join('sub', 'b.yaml').read()
+    assert 'c: 3\n' == src.join('ignored.txt').read()
+
+@pytest.mark.parametrize(('params'), [
+    ['--in-place'],
+    ['--in-place', '-i', 'a', '-o', 'a.out'],
+    ['--in-place', 'dir', '--output-dir', 'out'],
+    ['--in-place', '--stream', '-i', 'a'],
+    ['--in-place', '--files-from', 'list'],
+    ])
+def test_in_place_usage_error(tmpdir, params):
+    tmpdir.join('a').write('{a: 1}')
+    tmpdir.mkdir('dir').join('c.yml').write('{c: 3}')
+    tmpdir.join('list').write('a\ta.out\n')
+    p = subprocess.Popen(
+            [script_path] + params,
+            cwd = tmpdir.strpath,
+            stdout = subprocess.PIPE,
+            stderr = subprocess.PIPE,
+            )
+    stdout, stderr = p.communicate()
+    assert 2 == p.returncode
+    assert '{a: 1}' == tmpdir.join('a').read()
+    assert '{c: 3}' == tmpdir.join('dir', 'c.yml').read()
+
+@pytest.mark.parametrize(('params'), [
+    ['-i', 'in', '-o', 'out'],
+    ['-i', 'in', '-o', 'out', '-i', 'in', '-o', 'out2', '-j', '2'],
+    ['-i', 'in', '-o', 'out', '--no-libyaml'],
+    ])
+def test_cache(tmpdir, params):
+    tmpdir.join('in').write('{a: [1]}')
+    subprocess.check_call([script_path, '--cache-dir', 'cache'] + params, cwd = tmpdir.strpath)
+    assert 'a:\n- 1\n' == tmpdir.join('out').read()
+    cache_entries = tmpdir.join('cache').listdir('[!.]*')
+    assert 1 == len(cache_entries)
+    assert 'a:\n- 1\n' == cache_entries[0].read()
+    # prove the second run is a lookup
+    cache_entries[0].write('cached: true\n')
+    subprocess.check_call([script_path, '--cache-dir', 'cache'] + params, cwd = tmpdir.strpath)
+    assert 'cached: true\n' == tmpdir.join('out').read()
+    tmpdir.join('in').write('{a: [2]}')
+    subprocess.check_call([script_path, '--cache-dir', 'cache'] + params, cwd = tmpdir.strpath)
+    assert 'a:\n- 2\n' == tmpdir.join('out').read()
+    assert 2 == len(tmpdir.join('cache').listdir('[!.]*'))
+
+def test_cache_in_place(tmpdir):
+    tmpdir.join('a').write('{a: 1}')
+    tmpdir.join('b').write('{a: 1}')
+    subprocess.check_call(
+        [script_path, '--cache-dir', 'cache', '--cache-size', '1024', '--in-place', 'a', 'b'],
+        cwd = tmpdir.strpath,
+        )
+    assert 'a: 1\n' == tmpdir.join('a').read()
+    assert 'a: 1\n' == tmpdir.join('b').read()
+    assert 1 == len(tmpdir.join('cache').listdir('[!.]*'))
+
+def test_cache_stream_usage_error(tmpdir):
+    p = subprocess.Popen(
+            [script_path, '--cache-dir', 'cache', '--stream'],
+            cwd = tmpdir.strpath,
+            stdin = subprocess.PIPE,
+            stdout = subprocess.PIPE,
+            stderr = subprocess.PIPE,
+            )
+    stdout, stderr = p.communicate(b'a: 1')
+    assert 2 == p.returncode
+    assert not tmpdir.join('cache').exists()
+
+def test_output_symlink(tmpdir):
+    tmpdir.join('in').write('{a: 1}')
+    tmpdir.mkdir('sub').join('real').write('previous')
+    tmpdir.join('link').mksymlinkto('sub/real')
+    tmpdir.join('dangling').mksymlinkto('sub/new')
+    subprocess.check_call([script_path, '-i', 'in', '-o', 'link'], cwd = tmpdir.strpath)
+    subprocess.check_call([script_path, '-i', 'in', '-o', 'dangling'], cwd = tmpdir.strpath)
+    assert tmpdir.join('link').islink()
+    assert tmpdir.join('dangling').islink()
+    assert 'a: 1\n' == tmpdir.join('sub', 'real').read()
+    assert 'a: 1\n' == tmpdir.join('sub', 'new').read()
+    assert ['new', 'real'] == sorted(p.basename for p in tmpdir.join('sub').listdir())
+
+def test_output_hardlink(tmpdir):
+    tmpdir.join('in').write('{a: 1}')
+    tmpdir.join('out').write('previous')
+    os.link(tmpdir.join('out').strpath, tmpdir.join('out2').strpath)
+    subprocess.check_call([script_path, '-i', 'in', '-o', 'out'], cwd = tmpdir.strpath)
+    assert 'a: 1\n' == tmpdir.join('out2').read()
+    assert tmpdir.join('out').stat().ino == tmpdir.join('out2').stat().ino
+
+def test_output_device(tmpdir):
+    tmpdir.join('in').write('{a: 1}')
+    assert b'a: 1\n' == subprocess.check_output(
+            [script_path, '-i', 'in', '-o', '/dev/stdout'],
+            cwd = tmpdir.strpath,
+            )
+    assert ['in'] == [p.basename for p in tmpdir.listdir()]
+    null_stat = os.stat('/dev/null')
+    subprocess.check_call([script_path, '-i', 'in', '-o', '/dev/null'], cwd = tmpdir.strpath)
+    assert null_stat.st_rdev == os.stat('/dev/null').st_rdev
+    assert null_stat.st_ino == os.stat('/dev/null').st_ino
+
+def test_in_place_symlink(tmpdir):
+    tmpdir.mkdir('sub').join('real.yml').write('{a: 1}')
+    tmpdir.join('link.yml').mksymlinkto('sub/real.yml')
+    subprocess.check_call([script_path, '--in-place', 'link.yml'], cwd = tmpdir.strpath)
+    assert tmpdir.join('link.yml').islink()
+    assert 'a: 1\n' == tmpdir.join('sub', 'real.yml').read()
+    assert ['real.yml'] == [p.basename for p in tmpdir.join('sub').listdir()]
+
+@pytest.mark.parametrize(('params', 'expected_stdout'), [
+    [[], b'1\n...\n'],
+    [['--no-libyaml'], b'1\n...\n'],
+    [['--libyaml-emitter'], b'1\n'],
+    [['--libyaml-emitter', '--stream'], b'1\n'],
+    ])
+def test_libyaml_emitter(params, expected_stdout):
+    ioex_yamlex = pytest.importorskip('ioex.yamlex')
+    if '--libyaml-emitter' in params and not ioex_yamlex.libyaml_available():
+        pytest.skip('pyyaml built without libyaml')
+    p = subprocess.Popen(
+            [script_path] + params,
+            stdin = subprocess.PIPE,
+            stdout = subprocess.PIPE,
+            )
+    stdout, stderr = p.communicate(b'1\n')
+    assert expected_stdout == stdout
+
+@pytest.mark.parametrize(('params'), [
+    [],
+    ['--stream'],
+    ['--no-libyaml'],
+    ['-i', 'in.yml'],
+    ['-i', 'in.yml', '--in-place'],
+    ['in.yml', '--output-dir', 'out', '-j', '2'],
+    ])
+def test_python_tags_rejected(tmpdir, params):
+    document = '!!python/object/apply:os.mkdir [%s]\n' % tmpdir.join('pwned').strpath
+    tmpdir.join('in.yml').write(document)
+    p = subprocess.Popen(
+            [script_path] + params,
+            cwd = tmpdir.strpath,
+            stdin = subprocess.PIPE,
+            stdout = subprocess.PIPE,
+            stderr = subprocess.PIPE,
+            )
+    stdout, stderr = p.communicate(document.encode())
+    assert 0 != p.returncode
+    assert b'ConstructorError' in stderr
+    assert not tmpdir.join('pwned').exists()
+    assert document == tmpdir.join('in.yml').read()
+
+@pytest.mark.parametrize(('params'), [['--unsafe'], ['--unsafe', '--stream']])
+def test_unsafe(params):
+    p = subprocess.Popen(
+            [script_path] + params,
+            stdin = subprocess.PIPE,
+            stdout = subprocess.PIPE,
+            )
+    stdout, stderr = p.communicate(b'!!python/tuple [1, 2]\n')
+    assert 0 == p.returncode
+    assert b'!!python/tuple\n- 1\n- 2\n' == stdout
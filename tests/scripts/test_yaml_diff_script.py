@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+pytest.importorskip('yaml')
+import os
+import subprocess
+
+script_path = os.path.realpath(os.path.join(__file__, '..', '..', '..', 'scripts', 'yaml-diff'))
+
+def test_files(tmpdir):
+    old_file = tmpdir.join('old')
+    old_file.write('{a: 1, b: 2}')
+    new_file = tmpdir.join('new')
+    new_file.write('{a: 1, b: 3}')
+    p = subprocess.Popen(
+            [script_path, '-U', '0', old_file.strpath, new_file.strpath],
+            stdout = subprocess.PIPE,
+            stderr = subprocess.PIPE,
+            )
+    stdout, stderr = p.communicate()
+    assert 1 == p.returncode
+    assert ('--- %s\n+++ %s\n@@ -2 +2 @@\n-b: 2\n+b: 3\n' % (old_file.strpath, new_file.strpath)).encode() == stdout
+    assert ('1 of 1 files changed\nchanged: %s\n' % new_file.strpath).encode() == stderr
+
+def test_trees(tmpdir):
+    for name in ['old', 'new']:
+        tmpdir.mkdir(name).join('a.yml').write('a: 1')
+    tmpdir.join('new', 'b.yaml').write('b: 1')
+    p = subprocess.Popen(
+            [script_path, '-j', '2', tmpdir.join('old').strpath, tmpdir.join('new').strpath],
+            stdout = subprocess.PIPE,
+            stderr = subprocess.PIPE,
+            )
+    stdout, stderr = p.communicate()
+    assert 1 == p.returncode
+    assert ('1 of 2 files changed\nchanged: %s\n' % tmpdir.join('new', 'b.yaml').strpath).encode() == stderr
+
+def test_unchanged(tmpdir):
+    tmpdir.join('old').write('[1, 2]')
+    tmpdir.join('new').write('- 1\n- 2\n')
+    p = subprocess.Popen(
+            [script_path, tmpdir.join('old').strpath, tmpdir.join('new').strpath],
+            stdout = subprocess.PIPE,
+            stderr = subprocess.PIPE,
+            )
+    stdout, stderr = p.communicate()
+    assert 0 == p.returncode
+    assert b'' == stdout
+    assert b'0 of 1 files changed\n' == stderr
+
+def test_cache(tmpdir):
+    tmpdir.join('old').write('{a: 1, b: 2}')
+    tmpdir.join('new').write('{a: 1, b: 3}')
+    outputs = []
+    for run in range(2):
+        p = subprocess.Popen(
+                [script_path, '--cache-dir', 'cache', 'old', 'new'],
+                cwd = tmpdir.strpath,
+                stdout = subprocess.PIPE,
+                stderr = subprocess.PIPE,
+                )
+        outputs.append(p.communicate())
+        assert 1 == p.returncode
+    assert outputs[0] == outputs[1]
+    assert b'- b: 2\n' in outputs[0][0]
+    assert 2 == len(tmpdir.join('cache').listdir('[!.]*'))
+
+def test_error(tmpdir):
+    for name in ['old', 'new']:
+        tmpdir.mkdir(name).join('a.yml').write('a: 1')
+        tmpdir.join(name, 'c.yml').write('c: 1')
+    tmpdir.join('new', 'a.yml').write('{a: [}')
+    tmpdir.join('new', 'c.yml').write('c: 2')
+    p = subprocess.Popen(
+            [script_path, '-j', '2', 'old', 'new'],
+            cwd = tmpdir.strpath,
+            stdout = subprocess.PIPE,
+            stderr = subprocess.PIPE,
+            )
+    stdout, stderr = p.communicate()
+    assert 2 == p.returncode
+    assert b'+ c: 2' in stdout
+    assert stderr.startswith(b'error: old/a.yml new/a.yml: ')
+    assert stderr.endswith(b'1 of 2 files changed\nchanged: new/c.yml\n1 of 2 files failed\n')
+
+def test_ioex_tags(tmpdir):
+    for name, value in [('old', 1), ('new', 2)]:
+        tmpdir.mkdir(name).join('a.yml').write('a: !figure %d m\n' % value)
+        tmpdir.join(name, 'b.yml').write('b: !period 2017-01-01T00:00:00Z/2017-01-02T00:00:00Z\n')
+    for params, returncode in [[[], 2], [['--ioex-tags'], 1]]:
+        p = subprocess.Popen(
+                [script_path, '-j', '2', 'old', 'new'] + params,
+                cwd = tmpdir.strpath,
+                stdout = subprocess.PIPE,
+                stderr = subprocess.PIPE,
+                )
+        stdout, stderr = p.communicate()
+        assert returncode == p.returncode
+    assert stderr.endswith(b'1 of 2 files changed\nchanged: new/a.yml\n')
@@ -19,7 +19,7 @@ def test_to_yaml():
         Dumper=TestDumper,
      default_flow_style=False)
 
-    loaded_dict = yaml.load(generated_yaml)
+    loaded_dict = yaml.load(generated_yaml, Loader=yaml.SafeLoader)
     assert isinstance(loaded_dict, dict)
     expected_dict = {
         'A': 1.1,
@@ -43,7 +43,7 @@ def test_register_yaml_representer():
         Dumper=TestDumper,
      default_flow_style=False)
 
-    loaded_dict = yaml.load(generated_yaml)
+    loaded_dict = yaml.load(generated_yaml, Loader=yaml.SafeLoader)
     assert isinstance(loaded_dict, dict)
     expected_dict = {
         'A': 1.1,
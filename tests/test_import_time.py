@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+import subprocess
+import sys
+
+
+@pytest.mark.parametrize(('module', 'deferred_modules'), [
+    ['ioex', ['readline', 'difflib', 'hashlib', 'yaml', 'ioex.yamlex', 'concurrent.futures']],
+    ['ioex.datetimeex', ['dateutil', 'numpy', 'yaml']],
+    ['ioex.classex', ['dateutil', 'numpy', 'yaml']],
+    ['ioex.calcex', ['numpy', 'dateutil']],
+])
+def test_deferred_imports(module, deferred_modules):
+    loaded_modules = subprocess.check_output([
+        sys.executable, '-c',
+        'import sys, {}; print(" ".join(sys.modules))'.format(module),
+    ]).decode().split()
+    assert module in loaded_modules
+    assert [] == [m for m in deferred_modules if m in loaded_modules]
@@ -4,6 +4,8 @@ import pytest
 yaml = pytest.importorskip('yaml')
 import datetime
 import ioex.datetimeex
+import ioex.yamlex
+from ioex.calcex import Figure
 from ioex.shell import TextColor
 
 @pytest.mark.parametrize(('a', 'b', 'expected_diff_lines'), [
@@ -159,3 +161,103 @@ def test_yaml_diff(a, b, expected_diff_lines):
     generated_diff = ioex.yaml_diff(a, b, colors = True)
     assert expected_diff == generated_diff, \
             '\ngenerated: %r\nexpected:  %r' % (generated_diff, expected_diff)
+
+@pytest.mark.parametrize(('structural'), [False, True])
+@pytest.mark.parametrize(('a', 'b', 'context', 'expected_diff_lines'), [
+    [
+        [1, 2, 3],
+        [1, 2, 3],
+        1,
+        [],
+        ],
+    [
+        list(range(10)),
+        [0, 1, 2, 3, 4, 5, 7, 8, 9],
+        1,
+        [
+            u'@@ -6,3 +6,2 @@',
+            u' - 5',
+            u'-- 6',
+            u' - 7',
+            ],
+        ],
+    [
+        {'a': 1, 'b': 2, 'c': 3, 'd': 4, 'e': 5, 'f': 6},
+        {'a': 0, 'b': 2, 'c': 3, 'd': 4, 'e': 5, 'f': 7},
+        1,
+        [
+            u'@@ -1,2 +1,2 @@',
+            u'-a: 1',
+            u'+a: 0',
+            u' b: 2',
+            u'@@ -5,2 +5,2 @@',
+            u' e: 5',
+            u'-f: 6',
+            u'+f: 7',
+            ],
+        ],
+    [
+        {'a': 1, 'b': 2, 'c': 3, 'd': 4, 'e': 5, 'f': 6},
+        {'a': 0, 'b': 2, 'c': 3, 'd': 4, 'e': 5, 'f': 7},
+        2,
+        [
+            u'@@ -1,6 +1,6 @@',
+            u'-a: 1',
+            u'+a: 0',
+            u' b: 2',
+            u' c: 3',
+            u' d: 4',
+            u' e: 5',
+            u'-f: 6',
+            u'+f: 7',
+            ],
+        ],
+    ])
+def test_yaml_diff_context(a, b, context, expected_diff_lines, structural):
+    expected_diff = u''.join(l + u'\n' for l in expected_diff_lines)
+    generated_diff = ioex.yaml_diff(a, b, context = context, structural = structural)
+    assert expected_diff == generated_diff, \
+            '\ngenerated: %r\nexpected:  %r' % (generated_diff, expected_diff)
+
+def test_yaml_diff_context_colors():
+    assert [
+        TextColor.cyan  + u'@@ -1,2 +1,2 @@\n' + TextColor.default,
+        TextColor.red   + u'-- 1\n' + TextColor.default,
+        TextColor.green + u'+- 3\n' + TextColor.default,
+        TextColor.default + u' - 2\n' + TextColor.default,
+        ] == list(ioex.yaml_diff_lines([1, 2], [3, 2], colors = True, context = 1))
+
+def test_yaml_diff_lines_iterator():
+    diff_lines = ioex.yaml_diff_lines([1, 2], [1, 3])
+    assert iter(diff_lines) is diff_lines
+    assert [u'  - 1\n', u'- - 2\n', u'+ - 3\n'] \
+            == [l for l in diff_lines if not l.startswith(u'?')]
+
+@pytest.mark.parametrize(('context'), [None, 1])
+def test_yaml_diff_cache(tmpdir, context):
+    cache = ioex.yamlex.OutputCache(tmpdir.strpath)
+    a, b = {'a': [1, 2], u'ä': u'ö'}, {'a': [1, 3], u'ä': u'ö'}
+    expected_diff = ioex.yaml_diff(a, b, context = context)
+    assert expected_diff == ioex.yaml_diff(a, b, context = context, cache = cache)
+    assert 2 == len(tmpdir.listdir('[!.]*'))
+    assert expected_diff == ioex.yaml_diff(a, b, context = context, cache = cache)
+    assert 2 == len(tmpdir.listdir('[!.]*'))
+    assert ioex.yaml_diff(a, {'a': 1}, context = context) \
+            == ioex.yaml_diff(a, {'a': 1}, context = context, cache = cache)
+    assert 3 == len(tmpdir.listdir('[!.]*'))
+
+def test_yaml_diff_cache_unpicklable(tmpdir):
+    cache = ioex.yamlex.OutputCache(tmpdir.strpath)
+    a = [lambda: None]
+    assert ioex.yaml_diff(a, []) == ioex.yaml_diff(a, [], cache = cache)
+    assert 1 == len(tmpdir.listdir('[!.]*'))
+
+def test_yaml_diff_cache_custom_dumper(tmpdir):
+    cache = ioex.yamlex.OutputCache(tmpdir.strpath)
+    dumpers = [ioex.yamlex.dumper_class(), ioex.yamlex.dumper_class()]
+    Figure.register_yaml_representer(dumpers[0])
+    Figure.register_yaml_representer(dumpers[1], tag=u'!other')
+    a, b = [Figure(1, u'm')], [Figure(2, u'm')]
+    assert u'!figure 1 m' in ioex.yaml_diff(a, b, dumper = dumpers[0], context = 0, cache = cache)
+    assert u'!other 1 m' in ioex.yaml_diff(a, b, dumper = dumpers[1], context = 0, cache = cache)
+    assert [] == tmpdir.listdir('[!.]*')
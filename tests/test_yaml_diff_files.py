@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+yaml = pytest.importorskip('yaml')
+import ioex
+
+
+@pytest.fixture
+def trees(tmpdir):
+    old = tmpdir.mkdir('old')
+    new = tmpdir.mkdir('new')
+    old.join('changed.yml').write('a: 1\nb: [1, 2]\n')
+    new.join('changed.yml').write('a: 2\nb: [1, 2]\n')
+    old.join('identical.yml').write('a: 1\n')
+    new.join('identical.yml').write('a: 1\n')
+    old.mkdir('sub').join('reformatted.yaml').write('{a: [1]}\n')
+    new.mkdir('sub').join('reformatted.yaml').write('a:\n- 1\n')
+    old.join('removed.yml').write('r: 1\n')
+    new.join('added.yml').write('n: 1\n')
+    old.join('ignored.txt').write('{')
+    return old, new
+
+
+@pytest.mark.parametrize(('processes'), [1, 2])
+def test_yaml_diff_trees(trees, processes):
+    old, new = trees
+    results = list(ioex.yaml_diff_trees(
+        old.strpath, new.strpath, processes=processes, structural=True))
+    diffs = {(r.old_path, r.new_path): r.diff for r in results}
+    assert {
+        (None, new.join('added.yml').strpath): u'- null\n- ...\n+ n: 1\n',
+        (old.join('changed.yml').strpath, new.join('changed.yml').strpath):
+            u'- a: 1\n+ a: 2\n  b:\n  - 1\n  - 2\n',
+        (old.join('identical.yml').strpath, new.join('identical.yml').strpath): u'',
+        (old.join('removed.yml').strpath, None): u'- r: 1\n+ null\n+ ...\n',
+        (old.join('sub', 'reformatted.yaml').strpath,
+         new.join('sub', 'reformatted.yaml').strpath): u'',
+    } == diffs
+
+
+def test_yaml_diff_files_identical_not_loaded(tmpdir):
+    invalid = tmpdir.join('invalid.yml')
+    invalid.write('{')
+    invalid_copy = tmpdir.join('invalid-copy.yml')
+    invalid_copy.write('{')
+    assert [ioex.YamlDiffResult(invalid.strpath, invalid_copy.strpath, u'')] \
+        == list(ioex.yaml_diff_files([(invalid.strpath, invalid_copy.strpath)]))
+
+
+@pytest.mark.parametrize(('processes'), [1, 3])
+def test_yaml_diff_files_kwargs(tmpdir, processes):
+    pairs = []
+    for i in range(8):
+        tmpdir.join('%d-old.yml' % i).write('[1, %d]' % i)
+        tmpdir.join('%d-new.yml' % i).write('[1, %d]' % (i + 1))
+        pairs.append((tmpdir.join('%d-old.yml' % i).strpath, tmpdir.join('%d-new.yml' % i).strpath))
+    results = ioex.yaml_diff_files(pairs, processes=processes, context=0)
+    assert {
+        ioex.YamlDiffResult(old_path, new_path, u'@@ -2 +2 @@\n-- %d\n+- %d\n' % (i, i + 1))
+        for i, (old_path, new_path) in enumerate(pairs)
+    } == set(results)
+
+
+@pytest.mark.parametrize(('processes'), [1, 2])
+def test_yaml_diff_files_error(tmpdir, processes):
+    tmpdir.join('invalid-old.yml').write('a: 1')
+    tmpdir.join('invalid-new.yml').write('{a: [}')
+    tmpdir.join('changed-old.yml').write('a: 1')
+    tmpdir.join('changed-new.yml').write('a: 2')
+    pairs = [(tmpdir.join(n + '-old.yml').strpath, tmpdir.join(n + '-new.yml').strpath)
+             for n in ['invalid', 'changed']]
+    results = {(r.old_path, r.new_path): r for r in ioex.yaml_diff_files(
+        pairs, processes=processes, context=0)}
+    invalid = results[pairs[0]]
+    assert u'' == invalid.diff
+    assert invalid.error.startswith(u'ParserError: ')
+    assert ioex.YamlDiffResult(pairs[1][0], pairs[1][1], u'@@ -1 +1 @@\n-a: 1\n+a: 2\n') \
+        == results[pairs[1]]
+
+
+@pytest.mark.parametrize(('processes'), [1, 2])
+@pytest.mark.parametrize(('loader'), [None, yaml.SafeLoader])
+def test_yaml_diff_files_register_constructors(tmpdir, processes, loader):
+    from ioex.calcex import Figure
+    from ioex.datetimeex import Duration
+    tmpdir.join('old.yml').write('a: !figure 1 m\nb: !duration {days: 1}\n')
+    tmpdir.join('new.yml').write('a: !figure 2 m\nb: !duration {days: 1}\n')
+    pair = (tmpdir.join('old.yml').strpath, tmpdir.join('new.yml').strpath)
+    assert ioex.yaml_diff_files([pair], loader=loader, processes=processes)
+    result, = ioex.yaml_diff_files(
+        [pair],
+        loader=loader,
+        processes=processes,
+        register_constructors=[Figure.register_yaml_constructor,
+                               Duration.register_yaml_constructor],
+        context=0,
+    )
+    assert result.error is None
+    assert [u'-_value:1', u'+_value:2'] \
+        == [l.replace(u' ', u'') for l in result.diff.splitlines()[1:]]
+    assert 'figure' not in yaml.SafeLoader.yaml_constructors
+
+
+@pytest.mark.parametrize(('processes'), [1, 2])
+def test_yaml_diff_files_unbounded_pairs(tmpdir, processes):
+    tmpdir.join('old').write('a: 1\n')
+    tmpdir.join('new').write('a: 2\n')
+    consumed = []
+
+    def pairs():
+        while True:
+            consumed.append(None)
+            yield tmpdir.join('old').strpath, tmpdir.join('new').strpath
+    results = ioex.yaml_diff_files(pairs(), processes=processes, structural=True)
+    assert u'- a: 1\n+ a: 2\n' == next(results).diff
+    results.close()
+    assert len(consumed) <= 2 * processes + 1
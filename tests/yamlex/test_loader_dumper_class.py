@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+yaml = pytest.importorskip('yaml')
+import datetime
+import ioex
+import ioex.yamlex
+from ioex import AutoDict
+from ioex.calcex import Figure
+from ioex.datetimeex import Duration, Period
+
+libyaml_params = [False, pytest.param(True, marks=pytest.mark.skipif(
+    not ioex.yamlex.libyaml_available(),
+    reason='pyyaml built without libyaml',
+))]
+
+
+@pytest.mark.parametrize(('safe', 'libyaml', 'expected_base'), [
+    [True, False, yaml.SafeLoader],
+    [False, False, yaml.Loader],
+    [True, True, getattr(yaml, 'CSafeLoader', None)],
+    [False, True, getattr(yaml, 'CLoader', None)],
+])
+def test_loader_class(safe, libyaml, expected_base):
+    if libyaml and not ioex.yamlex.libyaml_available():
+        pytest.skip('pyyaml built without libyaml')
+    loader = ioex.yamlex.loader_class(safe=safe, libyaml=libyaml)
+    assert expected_base in loader.__bases__
+    assert {'a': [1]} == yaml.load('a: [1]', Loader=loader)
+
+
+@pytest.mark.parametrize(('safe', 'libyaml', 'expected_base'), [
+    [True, False, yaml.SafeDumper],
+    [False, False, yaml.Dumper],
+    [True, True, getattr(yaml, 'CSafeDumper', None)],
+    [False, True, getattr(yaml, 'CDumper', None)],
+])
+def test_dumper_class(safe, libyaml, expected_base):
+    if libyaml and not ioex.yamlex.libyaml_available():
+        pytest.skip('pyyaml built without libyaml')
+    dumper = ioex.yamlex.dumper_class(safe=safe, libyaml=libyaml)
+    assert expected_base in dumper.__bases__
+    assert 'a:\n- 1\n' == yaml.dump({'a': [1]}, Dumper=dumper, default_flow_style=False)
+
+
+def test_loader_class_prefers_libyaml():
+    loader = ioex.yamlex.loader_class()
+    if ioex.yamlex.libyaml_available():
+        assert yaml.CSafeLoader in loader.__bases__
+    else:
+        assert yaml.SafeLoader in loader.__bases__
+
+
+def test_libyaml_unavailable(monkeypatch):
+    monkeypatch.setattr(yaml, '__with_libyaml__', False)
+    assert yaml.SafeLoader in ioex.yamlex.loader_class().__bases__
+    assert yaml.Dumper in ioex.yamlex.dumper_class().__bases__
+    with pytest.raises(ImportError):
+        ioex.yamlex.loader_class(libyaml=True)
+
+
+def test_classes_independent():
+    loader_a = ioex.yamlex.loader_class()
+    loader_b = ioex.yamlex.loader_class()
+    Figure.register_yaml_constructor(loader_a)
+    assert Figure(1, 'm') == yaml.load('!figure 1 m', Loader=loader_a)
+    with pytest.raises(yaml.constructor.ConstructorError):
+        yaml.load('!figure 1 m', Loader=loader_b)
+
+
+@pytest.mark.parametrize(('libyaml'), libyaml_params)
+def test_register_yaml_figure(libyaml):
+    dumper = ioex.yamlex.dumper_class(safe=True, libyaml=libyaml)
+    Figure.register_yaml_representer(dumper)
+    loader = ioex.yamlex.loader_class(libyaml=libyaml)
+    Figure.register_yaml_constructor(loader)
+    figures = [Figure(1.5, u'm/s²'), Figure([1, 2], 'kg')]
+    assert figures == yaml.load(yaml.dump(figures, Dumper=dumper), Loader=loader)
+
+
+@pytest.mark.parametrize(('libyaml'), libyaml_params)
+def test_register_yaml_duration_period(libyaml):
+    dumper = ioex.yamlex.dumper_class(safe=True, libyaml=libyaml)
+    Duration.register_yaml_representer(dumper)
+    Period.register_yaml_representer(dumper)
+    loader = ioex.yamlex.loader_class(libyaml=libyaml)
+    Duration.register_yaml_constructor(loader)
+    Period.register_yaml_constructor(loader)
+    data = [
+        Duration(years=1, minutes=3),
+        Period(
+            start=datetime.datetime(2016, 7, 29, 21, 59, 13),
+            end=datetime.datetime(2017, 8, 30, 22, 32, 12),
+        ),
+    ]
+    assert data == yaml.load(yaml.dump(data, Dumper=dumper), Loader=loader)
+
+
+@pytest.mark.parametrize(('libyaml'), libyaml_params)
+def test_register_yaml_autodict(libyaml):
+    dumper = ioex.yamlex.dumper_class(safe=True, libyaml=libyaml)
+    AutoDict.register_yaml_representer(dumper)
+    d = AutoDict()
+    d['a']['b'] = 1
+    loaded = yaml.load(
+        yaml.dump(d, Dumper=dumper),
+        Loader=ioex.yamlex.loader_class(libyaml=libyaml),
+    )
+    assert {'a': {'b': 1}} == loaded
+
+
+@pytest.mark.parametrize(('libyaml'), libyaml_params + [None])
+def test_yaml_diff_libyaml(libyaml):
+    assert u'  - 1\n- - 2\n  - 3\n' == ioex.yaml_diff([1, 2, 3], [1, 3], libyaml=libyaml)
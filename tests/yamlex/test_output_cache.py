@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+yaml = pytest.importorskip('yaml')
+import os
+import pickle
+import ioex
+import ioex.yamlex
+from ioex.yamlex import OutputCache
+
+
+def test_get_set(tmpdir):
+    cache = OutputCache(tmpdir.join('cache').strpath)
+    key = cache.key(b'{a: 1}')
+    assert cache.get(key) is None
+    cache.set(key, b'a: 1\n')
+    assert b'a: 1\n' == cache.get(key)
+    assert b'a: 1\n' == OutputCache(tmpdir.join('cache').strpath).get(key)
+    assert [key] == [p.basename for p in tmpdir.join('cache').listdir('[!.]*')]
+
+
+@pytest.mark.parametrize(('data', 'options'), [
+    [b'{a: 1}', ('x', False)],
+    [b'{a: 1}', ('x', True)],
+    [b'{a: 2}', ('x', False)],
+    [b'{a: 1}', ()],
+])
+def test_key(data, options):
+    cache = OutputCache('cache')
+    assert cache.key(b'{a: 1}', ('x', False)) != cache.key(data, options) \
+        or (data, options) == (b'{a: 1}', ('x', False))
+    assert cache.key(data, options) == OutputCache('other').key(data, options)
+
+
+def test_key_version(monkeypatch):
+    cache = OutputCache('cache')
+    key = cache.key(b'{a: 1}')
+    monkeypatch.setattr(ioex, '__version__', '0.0.0')
+    assert key != cache.key(b'{a: 1}')
+
+
+def test_evict_least_recently_used(tmpdir):
+    cache = OutputCache(tmpdir.strpath, max_size=8)
+    cache.set('a', b'aaa')
+    cache.set('b', b'bbb')
+    os.utime(tmpdir.join('a').strpath, (100, 100))
+    os.utime(tmpdir.join('b').strpath, (200, 200))
+    assert b'aaa' == cache.get('a')
+    cache.set('c', b'ccc')
+    assert ['a', 'c'] == sorted(p.basename for p in tmpdir.listdir('[!.]*'))
+    assert b'aaa' == cache.get('a')
+    assert b'ccc' == cache.get('c')
+
+
+def test_too_large(tmpdir):
+    cache = OutputCache(tmpdir.strpath, max_size=2)
+    cache.set('a', b'aaa')
+    assert cache.get('a') is None
+    assert [] == tmpdir.listdir('[!.]*')
+
+
+def test_shared_size(tmpdir):
+    OutputCache(tmpdir.strpath).set('a', b'aaa')
+    cache = OutputCache(tmpdir.strpath, max_size=4)
+    os.utime(tmpdir.join('a').strpath, (100, 100))
+    cache.set('b', b'bb')
+    assert ['b'] == [p.basename for p in tmpdir.listdir('[!.]*')]
+
+
+def test_pickle(tmpdir):
+    cache = OutputCache(tmpdir.strpath, max_size=16)
+    cache.set('a', b'aaa')
+    restored = pickle.loads(pickle.dumps(cache))
+    assert (tmpdir.strpath, 16) == (restored.path, restored.max_size)
+    assert b'aaa' == restored.get('a')
+
+
+def test_evict_low_water(tmpdir, monkeypatch):
+    cache = OutputCache(tmpdir.strpath, max_size=1000)
+    calls = {'evict': 0, '_entries': 0}
+    for name in calls:
+        def counted(self, method=getattr(OutputCache, name), name=name):
+            calls[name] += 1
+            return method(self)
+        monkeypatch.setattr(OutputCache, name, counted)
+    for i in range(300):
+        cache.set('%03d' % i, b'0123456789')
+        os.utime(tmpdir.join('%03d' % i).strpath, (i, i))
+    entries = tmpdir.listdir('[!.]*')
+    assert 800 <= 10 * len(entries) <= 1000
+    assert ['%03d' % i for i in range(300 - len(entries), 300)] \
+        == sorted(p.basename for p in entries)
+    # full scans when evicting every 20 writes & to create the index
+    assert 10 == calls['evict']
+    assert 11 == calls['_entries']
+    assert str(10 * len(entries)) == tmpdir.join('.size').read()
+
+
+def test_index_recreated(tmpdir):
+    cache = OutputCache(tmpdir.strpath, max_size=8)
+    cache.set('a', b'aaa')
+    tmpdir.join('.size').write('corrupt')
+    os.utime(tmpdir.join('a').strpath, (100, 100))
+    cache.set('b', b'bbb')
+    assert '6' == tmpdir.join('.size').read()
+    cache.set('c', b'ccc')
+    assert ['b', 'c'] == sorted(p.basename for p in tmpdir.listdir('[!.]*'))
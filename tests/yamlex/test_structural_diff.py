@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+yaml = pytest.importorskip('yaml')
+import ioex
+import ioex.yamlex
+from ioex.shell import TextColor
+
+
+@pytest.mark.parametrize(('a', 'b', 'expected_opcodes'), [
+    [[], [], []],
+    [[1, 2], [1, 2], [('equal', 0, 2, 0, 2)]],
+    [[1, 2, 3], [1, 3], [('equal', 0, 1, 0, 1), ('delete', 1, 2, 1, 1), ('equal', 2, 3, 1, 2)]],
+    [[1, 3], [1, 2, 3], [('equal', 0, 1, 0, 1), ('insert', 1, 1, 1, 2), ('equal', 1, 2, 2, 3)]],
+    [[1, 2], [3], [('replace', 0, 2, 0, 1)]],
+    [[{'a': 1}, [2]], [{'a': 1}, [3]], [('equal', 0, 1, 0, 1), ('replace', 1, 2, 1, 2)]],
+    [[1, True, 1.0], [1.0, 1, True], [('insert', 0, 0, 0, 1), ('equal', 0, 2, 1, 3), ('delete', 2, 3, 3, 3)]],
+])
+def test_sequence_opcodes(a, b, expected_opcodes):
+    assert expected_opcodes == ioex.yamlex.sequence_opcodes(a, b)
+
+
+def test_sequence_opcodes_max_cost():
+    assert [('replace', 0, 3, 0, 3)] \
+        == ioex.yamlex.sequence_opcodes([1, 2, 3], [4, 5, 6], max_cost=2)
+
+
+@pytest.mark.parametrize(('a', 'b', 'expected_diff_lines'), [
+    [
+        [1, 2, 3],
+        [1, 3],
+        [
+            u'  - 1',
+            u'- - 2',
+            u'  - 3',
+        ],
+    ],
+    [
+        {'a': {'b': [1, {'c': 1, 'd': [5, 6]}], 'e': u'ä'}, 'f': 1},
+        {'a': {'b': [1, {'c': 2, 'd': [5, 7]}], 'e': u'ö'}, 'g': 1},
+        [
+            u'  a:',
+            u'    b:',
+            u'    - 1',
+            u'-   - c: 1',
+            u'+   - c: 2',
+            u'      d:',
+            u'      - 5',
+            u'-     - 6',
+            u'+     - 7',
+            u'-   e: ä',
+            u'+   e: ö',
+            u'- f: 1',
+            u'+ g: 1',
+        ],
+    ],
+    [
+        [{'a': 1, 'b': 2}],
+        [{'b': 2}],
+        [
+            u'- - a: 1',
+            u'-   b: 2',
+            u'+ - b: 2',
+        ],
+    ],
+    [
+        {'k': []},
+        {'k': [1]},
+        [
+            u'- k: []',
+            u'+ k:',
+            u'+ - 1',
+        ],
+    ],
+    [
+        {'k': [1]},
+        {'k': [True]},
+        [
+            u'  k:',
+            u'- - 1',
+            u'+ - true',
+        ],
+    ],
+    [
+        u'abcdef',
+        u'abdf',
+        [
+            u'- abcdef',
+            u'+ abdf',
+            u'  ...',
+        ],
+    ],
+])
+def test_yaml_diff_structural(a, b, expected_diff_lines):
+    expected_diff = u'\n'.join(expected_diff_lines) + u'\n'
+    assert expected_diff == ioex.yaml_diff(a, b, structural=True)
+
+
+def test_yaml_diff_structural_colors():
+    expected_diff_lines = [
+        TextColor.default + u'  a: 1',
+        TextColor.red + u'- b: 2',
+        TextColor.green + u'+ b: 3',
+    ]
+    expected_diff = (u'\n' + TextColor.default).join(expected_diff_lines) \
+        + u'\n' + TextColor.default
+    assert expected_diff == ioex.yaml_diff(
+        {'a': 1, 'b': 2}, {'a': 1, 'b': 3}, colors=True, structural=True)
+
+
+def test_yaml_diff_structural_reconstruct():
+    a = {'x%d' % i: {'l': [i, {'m': str(i)}], 'n': None} for i in range(64)}
+    b = {k: {'l': list(v['l']), 'n': v['n']} for k, v in a.items()}
+    b['x3']['l'].insert(1, 'new')
+    b['x7']['l'][1] = {'m': 'changed'}
+    b['x9']['n'] = [1, 2]
+    del b['x11']
+    b['y'] = 1.5
+    diff = ioex.yaml_diff(a, b, structural=True).splitlines(True)
+    to_yaml = lambda d: yaml.dump(d, default_flow_style=False, allow_unicode=True)
+    assert to_yaml(a) == u''.join(l[2:] for l in diff if l[0] in u' -')
+    assert to_yaml(b) == u''.join(l[2:] for l in diff if l[0] in u' +')
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+import difflib
+import ioex.yamlex
+
+
+@pytest.mark.parametrize(('a', 'b'), [
+    [u'', u''],
+    [u'a\n', u'a\n'],
+    [u'a\n', u''],
+    [u'', u'a\nb\n'],
+    [u'a\nb\nc\n', u'a\nc\n'],
+    [u''.join(u'%d\n' % i for i in range(20)), u''.join(u'%d\n' % i for i in range(20) if i not in (3, 11))],
+    [u''.join(u'%d\n' % i for i in range(20)), u''.join(u'%d\n' % (i * 2) for i in range(20))],
+])
+@pytest.mark.parametrize(('context'), [0, 1, 3])
+def test_unified_diff_like_difflib(a, b, context):
+    expected_lines = list(difflib.unified_diff(
+        a.splitlines(True),
+        b.splitlines(True),
+        fromfile='a',
+        tofile='b',
+        n=context,
+    ))
+    generated_lines = list(ioex.yamlex.unified_diff(
+        ioex.yamlex.line_diff(a, b),
+        context=context,
+        from_name='a',
+        to_name='b',
+    ))
+    assert expected_lines == generated_lines
+
+
+def test_unified_diff_ignores_hints():
+    diff_lines = difflib.ndiff([u'abc\n', u'd\n'], [u'abd\n', u'd\n'])
+    assert [
+        u'@@ -1 +1 @@\n',
+        u'-abc\n',
+        u'+abd\n',
+    ] == list(ioex.yamlex.unified_diff(diff_lines, context=0))
+
+
+def test_unified_diff_lazy():
+    def diff_lines():
+        yield u'- a\n'
+        for i in range(10):
+            yield u'  %d\n' % i
+        raise StopIteration_()
+
+    class StopIteration_(Exception):
+        pass
+
+    generator = ioex.yamlex.unified_diff(diff_lines(), context=1)
+    assert [u'@@ -1,2 +1 @@\n', u'-a\n', u' 0\n'] \
+        == [next(generator) for _ in range(3)]